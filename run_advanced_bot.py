@@ -11,165 +11,313 @@ Features:
 
 import asyncio
 import sys
-from datetime import datetime
+import time
+from typing import Dict, List, Optional, Tuple
 
 from src.core.logger import log
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.eventloop import loop_name, run
+from src.core.http import close_session
+from src.blockchain.wallet import wallet_manager
+from src.blockchain.client import solana_client
 from src.signals.processor import signal_processor
-from src.signals.validator import signal_validator
+from src.signals.validator import signal_validator, ValidationResult
 from src.ai.agent import ai_agent
 from src.analysis.dexscreener import dex_analyzer
 from src.trading.manager import trade_manager
+from src.trading.simple_swapper import jupiter_swapper
 from src.monitoring.notifier import notifier
 from src.social.discord_monitor import run_discord_bot
 from src.trading.liquidity_sniper import run_sniper
 
+# Aggressive Strategy: scan DexScreener every 15s, pushed signals immediately
+LOOP_INTERVAL_S = 15
+
+# Console heartbeat every N iterations
+HEARTBEAT_EVERY = 10
+
+# Decision threshold (validation score + market data boosts)
+MIN_DECISION_SCORE = 70
+
+# Limit parallel signal evaluations (DexScreener / RPC rate limits)
+EVAL_CONCURRENCY = 3
+_eval_semaphore = asyncio.Semaphore(EVAL_CONCURRENCY)
+
+# Gemini Analyse (nur beratend) läuft in Worker Tasks, der Loop wartet nicht darauf
+AI_WORKERS = 4
+AI_QUEUE_SIZE = 32
+_ai_queue: asyncio.Queue = asyncio.Queue(maxsize=AI_QUEUE_SIZE)
+
+
+async def _init_wallet() -> Optional[Tuple[str, float]]:
+    """Load wallet and fetch SOL balance."""
+    if not settings.WALLET_PRIVATE_KEY:
+        return None
+    
+    wallet_manager.load_wallet()
+    pubkey = wallet_manager.get_public_key()
+    balance_sol = await solana_client.get_balance(pubkey)
+    return pubkey, balance_sol
+
+
+async def _init_jupiter() -> bool:
+    """Probe Jupiter once at startup (result is cached by the swapper)."""
+    return await jupiter_swapper._test_jupiter_availability()
+
+
+def _startup_banner() -> List[str]:
+    """Config / feature overview shown at startup."""
+    def flag(enabled) -> str:
+        return '✅' if enabled else '❌'
+    
+    return [
+        "=" * 70,
+        "🚀 Omni Profit Bot - Advanced Edition",
+        "=" * 70,
+        "",
+        "⚙️  Configuration:",
+        f"   Network: Solana {'Mainnet' if 'mainnet' in settings.SOLANA_RPC_URL else 'Devnet'}",
+        f"   Real Trades: {'✅ YES' if settings.ALLOW_REAL_TRANSACTIONS else '❌ NO (Simulation)'}",
+        f"   Emergency Stop: {'🛑 YES' if settings.EMERGENCY_STOP else '✅ NO'}",
+        "",
+        "🔥 Advanced Features:",
+        "   ✅ MEV Protection (Jito Bundles)",
+        "   ✅ Signal Validation (8 Checks)",
+        "   ✅ Transaction Speed Optimizer",
+        f"   ✅ Discord Server Monitor: {flag(settings.DISCORD_BOT_TOKEN)}",
+        "   ✅ Liquidity Sniper (WebSocket)",
+        "",
+        "🔌 Integrations:",
+        f"   Gemini AI: {flag(settings.GEMINI_API_KEY)}",
+        f"   Telegram: {flag(settings.TELEGRAM_API_ID)}",
+        f"   Discord: {flag(settings.DISCORD_BOT_TOKEN)}",
+        "",
+    ]
+
 
 async def initialize_components():
     """Initialize all bot components."""
-    log.info("system_initializing")
-    
-    print("=" * 70)
-    print("🚀 Omni Profit Bot - Advanced Edition")
-    print("=" * 70)
-    print()
+    log.info("system_initializing", event_loop=loop_name())
     
-    # Check config
-    print("⚙️  Configuration:")
-    print(f"   Network: Solana {'Mainnet' if 'mainnet' in settings.SOLANA_RPC_URL else 'Devnet'}")
-    print(f"   Real Trades: {'✅ YES' if settings.ALLOW_REAL_TRANSACTIONS else '❌ NO (Simulation)'}")
-    print(f"   Emergency Stop: {'🛑 YES' if settings.EMERGENCY_STOP else '✅ NO'}")
-    print()
+    # Startup probes laufen parallel zueinander (nicht zum Banner - write_lines
+    # ist synchron, die Tasks starten erst beim await): wallet balance (RPC)
+    # + Jupiter availability
+    probes = asyncio.gather(
+        _init_wallet(),
+        _init_jupiter(),
+        return_exceptions=True,
+    )
     
-    # Advanced Features
-    print("🔥 Advanced Features:")
-    print(f"   ✅ MEV Protection (Jito Bundles)")
-    print(f"   ✅ Signal Validation (8 Checks)")
-    print(f"   ✅ Transaction Speed Optimizer")
-    print(f"   ✅ Discord Server Monitor: {'✅' if settings.DISCORD_BOT_TOKEN else '❌'}")
-    print(f"   ✅ Liquidity Sniper (WebSocket)")
-    print()
+    write_lines(_startup_banner())
     
-    # Integrations
-    print("🔌 Integrations:")
-    print(f"   Gemini AI: {'✅' if settings.GEMINI_API_KEY else '❌'}")
-    print(f"   Telegram: {'✅' if settings.TELEGRAM_API_ID else '❌'}")
-    print(f"   Discord: {'✅' if settings.DISCORD_BOT_TOKEN else '❌'}")
-    print()
+    wallet_info, jupiter_ok = await probes
     
-    # Wallet
-    if settings.WALLET_PRIVATE_KEY:
-        from src.blockchain.wallet import wallet_manager
-        wallet_manager.load_wallet()
-        pubkey = wallet_manager.get_public_key()
-        print(f"💰 Wallet: {pubkey[:8]}...{pubkey[-8:]}")
-        
-        # Get balance
-        from src.blockchain.client import solana_client
-        try:
-            balance_sol = await solana_client.get_balance(pubkey)
-            print(f"💵 Balance: {balance_sol:.6f} SOL")
-        except:
-            print(f"💵 Balance: Unable to fetch")
+    lines = []
+    if isinstance(wallet_info, Exception):
+        log.error("wallet_init_failed", error=str(wallet_info))
+        lines.append("⚠️  Wallet: Unable to load")
+    elif wallet_info:
+        pubkey, balance_sol = wallet_info
+        lines.append(f"💰 Wallet: {pubkey[:8]}...{pubkey[-8:]}")
+        lines.append(f"💵 Balance: {balance_sol:.6f} SOL")
     else:
-        print("⚠️  No wallet configured")
+        lines.append("⚠️  No wallet configured")
     
-    print()
+    lines.append(f"🪐 Jupiter API: {'✅' if jupiter_ok is True else '❌ (Fallback Mode)'}")
+    lines.append("")
+    write_lines(lines)
     log.info("system_ready")
 
 
+async def evaluate_signal(signal) -> ValidationResult:
+    """Validate signal (bounded concurrency).
+    
+    Discord Signale bringen ihre ValidationResult in ``metadata`` mit -
+    kein zweiter RPC/HTTP Check und kein zweites ``_track_signal``.
+    """
+    validation = signal.metadata.get('validation')
+    if validation is not None:
+        return validation
+    
+    async with _eval_semaphore:
+        return await signal_validator.validate_signal(
+            signal.token_address,
+            source_channel=signal.source,
+        )
+
+
+def decide(validation: ValidationResult, token_data: Optional[Dict]) -> Tuple[Optional[Dict], str]:
+    """Simple decision - validation score + basic heuristics.
+    
+    Gemini (falls aktiv) analysiert akzeptierte Signale im Hintergrund,
+    nur als Log - die Trade-Entscheidung bleibt diese Heuristik.
+    
+    Returns:
+        (analysis, outcome) - outcome: invalid, no_market_data, rejected, accepted
+    """
+    if not validation.is_valid:
+        return None, "invalid"
+    
+    if not token_data:
+        return None, "no_market_data"
+    
+    score = validation.score
+    
+    # Boost score for good metrics
+    liquidity = token_data.get('liquidity_usd', token_data.get('liquidity', 0))
+    if liquidity > 50000:
+        score += 10
+    if token_data.get('volume_24h', 0) > 10000:
+        score += 5
+    
+    analysis = {
+        'score': min(100, score),
+        'confidence': validation.score / 100,
+        'reason': f'Validation {validation.score}/100',
+        'risk': 'MEDIUM',
+        'target_multiplier': 2.5,
+    }
+    
+    return analysis, "accepted" if analysis['score'] >= MIN_DECISION_SCORE else "rejected"
+
+
+def _signal_report(signal, validation, token_data, analysis, outcome) -> List[str]:
+    """Console lines for one analyzed signal (VERBOSE only)."""
+    lines = [
+        f"\n🔍 Analyzing: {signal.token_name} ({signal.token_address[:8]}...)",
+        f"   Validation Score: {validation.score}/100",
+    ]
+    
+    if outcome == "invalid":
+        lines.append(f"   ❌ REJECTED - {validation.warnings[0] if validation.warnings else 'Low score'}")
+    elif outcome == "no_market_data":
+        lines.append(f"   ❌ No market data")
+    else:
+        liquidity = token_data.get('liquidity_usd', token_data.get('liquidity', 0))
+        lines += [
+            f"   💰 Price: ${token_data['price_usd']:.6f}",
+            f"   💧 Liquidity: ${liquidity:,.0f}",
+            f"   🎯 Decision Score: {analysis['score']}/100",
+        ]
+        if outcome == "rejected":
+            lines.append(f"   ❌ Rejected")
+    
+    return lines
+
+
+async def ai_worker():
+    """Advisory Gemini analysis of traded tokens (logged, never trades)."""
+    while True:
+        signal, token_data = await _ai_queue.get()
+        try:
+            # Result is logged by the agent (ai_analysis_complete)
+            await ai_agent.analyze_token(
+                signal.token_address,
+                signal.token_name,
+                token_data,
+                signal.confidence,
+            )
+        except Exception as e:
+            log.error("ai_worker_error", token=signal.token_address, error=str(e))
+        finally:
+            _ai_queue.task_done()
+
+
+async def execute_decision(signal, token_data, analysis):
+    """Execute trade with MEV protection and notify."""
+    success = await trade_manager.execute_trade(token_data, analysis)
+    
+    if success:
+        print(f"✅ TRADE EXECUTED: {signal.token_name} ({signal.token_address[:8]}...)")
+        
+        # Notify
+        await notifier.send_trade_notification(
+            token_name=signal.token_name,
+            action="BUY",
+            amount_sol=0.05,
+            price=token_data['price_usd'],
+        )
+    else:
+        print(f"❌ Trade failed: {signal.token_name} ({signal.token_address[:8]}...)")
+
+
 async def run_trading_loop():
     """Main trading loop - Collect signals, analyze, trade."""
     log.info("trading_loop_starting")
     
     loop_count = 0
+    next_scan = 0.0
     
     while True:
         try:
-            loop_count += 1
-            log.info("trading_loop_iteration", count=loop_count)
+            # 1. Pushed signals immediately, DexScreener scan every LOOP_INTERVAL_S
+            wait_s = next_scan - time.monotonic()
+            if wait_s > 0:
+                signals = await signal_processor.wait_for_signals(timeout=wait_s)
+                if not signals:
+                    continue
+                iteration_start = time.monotonic()
+            else:
+                iteration_start = time.monotonic()
+                next_scan = iteration_start + LOOP_INTERVAL_S
+                signals = await signal_processor.collect_signals()
             
-            # 1. Collect signals
-            signals = await signal_processor.collect_signals()
+            loop_count += 1
             
             if signals:
-                log.info("signals_collected", count=len(signals))
-                print(f"\n📡 {len(signals)} signals collected")
+                # 2+3. Validate top signals concurrently, market data in one batch request
+                top_signals = signals[:3]
+                token_map, *evaluations = await asyncio.gather(
+                    dex_analyzer.get_tokens_batch([s.token_address for s in top_signals]),
+                    *(evaluate_signal(signal) for signal in top_signals),
+                    return_exceptions=True,
+                )
+                if isinstance(token_map, Exception):
+                    log.error("token_batch_error", error=str(token_map))
+                    token_map = {}
                 
-                for signal in signals[:3]:  # Process top 3
-                    print(f"\n🔍 Analyzing: {signal.token_name} ({signal.token_address[:8]}...)")
-                    
-                    # 2. Validate signal
-                    validation = await signal_validator.validate_signal(
-                        signal.token_address,
-                        source_channel=signal.source,
-                    )
-                    
-                    print(f"   Validation Score: {validation.score}/100")
-                    
-                    if not validation.is_valid:
-                        print(f"   ❌ REJECTED - {validation.warnings[0] if validation.warnings else 'Low score'}")
-                        continue
-                    
-                    # 3. Get market data
-                    token_data = await dex_analyzer.get_token_data(signal.token_address)
-                    
-                    if not token_data:
-                        print(f"   ❌ No market data")
+                for signal, evaluation in zip(top_signals, evaluations):
+                    if isinstance(evaluation, Exception):
+                        log.error("signal_evaluation_error", token=signal.token_address, error=str(evaluation))
                         continue
                     
-                    print(f"   💰 Price: ${token_data['price_usd']:.6f}")
-                    liquidity = token_data.get('liquidity_usd', token_data.get('liquidity', 0))
-                    print(f"   💧 Liquidity: ${liquidity:,.0f}")
-                    
-                    # 4. Simple Decision (Skip AI - too slow)
-                    # Use validation score + basic heuristics
-                    score = validation.score
-                    
-                    # Boost score for good metrics
-                    if liquidity > 50000:
-                        score += 10
-                    if token_data.get('volume_24h', 0) > 10000:
-                        score += 5
+                    token_data = token_map.get(signal.token_address)
+                    analysis, outcome = decide(evaluation, token_data)
                     
-                    analysis = {
-                        'score': min(100, score),
-                        'confidence': validation.score / 100,
-                        'reason': f'Validation {validation.score}/100',
-                        'risk': 'MEDIUM',
-                        'target_multiplier': 2.5,
-                    }
-                    
-                    print(f"   🎯 Decision Score: {analysis['score']}/100")
+                    log.info(
+                        "signal_analyzed",
+                        token=signal.token_address,
+                        validation=evaluation.score,
+                        score=analysis['score'] if analysis else None,
+                        outcome=outcome,
+                    )
+                    if settings.VERBOSE:
+                        write_lines(_signal_report(signal, evaluation, token_data, analysis, outcome))
                     
-                    if analysis.get('score', 0) < 70:
-                        print(f"   ❌ AI rejected")
+                    if outcome != "accepted":
                         continue
                     
-                    # 5. Execute trade with MEV protection
-                    print(f"   🚀 Executing trade with Jito protection...")
+                    # 5. Optional advisory AI analysis (non-blocking, does not gate the trade)
+                    if ai_agent.enabled:
+                        try:
+                            _ai_queue.put_nowait((signal, token_data))
+                        except asyncio.QueueFull:
+                            log.warning("ai_queue_full", token=signal.token_address)
                     
-                    success = await trade_manager.execute_trade(token_data, analysis)
-                    
-                    if success:
-                        print(f"   ✅ TRADE EXECUTED")
-                        
-                        # Notify
-                        await notifier.send_trade_notification(
-                            token_name=signal.token_name,
-                            action="BUY",
-                            amount_sol=0.05,
-                            price=token_data['price_usd'],
-                        )
-                    else:
-                        print(f"   ❌ Trade failed")
+                    # Sequential - sizing uses wallet balance
+                    await execute_decision(signal, token_data, analysis)
             
-            # 6. Monitor positions
-            await trade_manager.monitor_positions()
+            # One log record per iteration (signal count is logged by the processor)
+            log.info(
+                "trading_loop_iteration",
+                count=loop_count,
+                signals=len(signals),
+                duration_ms=round((time.monotonic() - iteration_start) * 1000),
+            )
             
-            # Sleep - Aggressive Strategy (15s)
-            print(f"\n💤 Sleeping 15s... (Loop #{loop_count})")
-            await asyncio.sleep(15)
+            if loop_count % HEARTBEAT_EVERY == 0:
+                print(f"\n💤 Waiting for signals... (Loop #{loop_count})")
         
         except KeyboardInterrupt:
             log.info("trading_loop_interrupted")
@@ -213,24 +361,34 @@ async def main():
         # Initialize
         await initialize_components()
         
-        print("=" * 70)
-        print("🎯 Bot gestartet!")
-        print("=" * 70)
-        print()
-        print("Active Modules:")
-        print("  ✅ Trading Loop (Signal → Validate → Trade)")
-        print("  ✅ Position Monitoring")
+        lines = [
+            "=" * 70,
+            "🎯 Bot gestartet!",
+            "=" * 70,
+            "",
+            "Active Modules:",
+            "  ✅ Trading Loop (Signal → Validate → Trade)",
+            "  ✅ Position Monitoring",
+        ]
         if settings.DISCORD_BOT_TOKEN:
-            print("  ✅ Discord Server Monitor")
-        print()
-        print("Press Ctrl+C to stop")
-        print()
+            lines.append("  ✅ Discord Server Monitor")
+        lines += ["", "Press Ctrl+C to stop", ""]
+        write_lines(lines)
         
         # Run all tasks
         tasks = [
             asyncio.create_task(run_trading_loop()),
+            asyncio.create_task(trade_manager.monitor_positions_loop()),
         ]
         
+        # Keep a fresh blockhash ready for on-chain sends
+        if settings.ALLOW_REAL_TRANSACTIONS:
+            tasks.append(asyncio.create_task(solana_client.refresh_blockhash_loop()))
+        
+        # AI analysis workers
+        if ai_agent.enabled:
+            tasks += [asyncio.create_task(ai_worker()) for _ in range(AI_WORKERS)]
+        
         # Optional: Discord monitor
         if settings.DISCORD_BOT_TOKEN:
             tasks.append(asyncio.create_task(run_discord_monitor()))
@@ -247,13 +405,18 @@ async def main():
         
         # Show summary
         summary = trade_manager.get_position_summary()
-        print("\n📊 Session Summary:")
-        print(f"   Trades Today: {summary['trades_today']}")
-        print(f"   Open Positions: {summary['open_positions']}")
-        print(f"   Closed Positions: {summary['closed_positions']}")
-        print()
-        print("✅ Bot stopped cleanly")
+        write_lines([
+            "\n📊 Session Summary:",
+            f"   Trades Today: {summary['trades_today']}",
+            f"   Open Positions: {summary['open_positions']}",
+            f"   Closed Positions: {summary['closed_positions']}",
+            "",
+            "✅ Bot stopped cleanly",
+        ])
+    
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
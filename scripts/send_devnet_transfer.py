@@ -6,7 +6,6 @@ Behavior:
  - Sends a small transfer (DEFAULT_LAMPORTS) from configured wallet to a target.
  - Notifies via notifier on success/failure (best-effort).
 """
-import os
 import asyncio
 import base58
 from decimal import Decimal
@@ -24,13 +23,13 @@ from src.monitoring.notifier import notify_critical
 DEFAULT_LAMPORTS = int(0.01 * 1_000_000_000)  # 0.01 SOL
 
 def _send_transfer(to_pubkey: str, lamports: int = DEFAULT_LAMPORTS) -> dict:
-    rpc = os.getenv('SOLANA_RPC_URL', settings.SOLANA_RPC_URL)
+    rpc = settings.SOLANA_RPC_URL
     if 'devnet' not in rpc.lower():
         log.warning('send_devnet_transfer_not_on_devnet', rpc=rpc)
         # Force devnet for safety
         rpc = 'https://api.devnet.solana.com'
 
-    ALLOW = os.getenv('ALLOW_REAL_TRANSACTIONS', 'false').lower() == 'true'
+    ALLOW = settings.ALLOW_REAL_TRANSACTIONS
     if not ALLOW:
         log.warning('send_devnet_transfer_blocked', reason='ALLOW_REAL_TRANSACTIONS not true')
 
@@ -6,7 +6,6 @@
 
 Run: PYTHONPATH=. python scripts/sign_only_test.py
 """
-import os
 import base64
 import asyncio
 from src.core.logger import setup_logger, log
@@ -43,7 +42,7 @@ async def simulate(tx_b64: str, rpc_url: str):
 
 def main():
     setup_logger()
-    rpc = os.getenv('SOLANA_RPC_URL', settings.SOLANA_RPC_URL)
+    rpc = settings.SOLANA_RPC_URL
 
     # Force Devnet for safety if not explicitly set
     if 'devnet' not in rpc.lower():
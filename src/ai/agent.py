@@ -1,35 +1,62 @@
-"""AI Agent - Token analysis using Google Gemini."""
+"""AI Agent - Token analysis using Google Gemini.
 
-import asyncio
-from typing import Dict, Optional
+Gemini wird direkt per REST über die geteilte aiohttp Session aufgerufen
+(kein SDK, kein Thread pro Request).
+"""
+
+import re
+from typing import Dict, Tuple
 from src.core.config import settings
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+# "SCORE: 85" Zeilen der Gemini Antwort (auch mit Markdown "**SCORE:**")
+_FIELD_PATTERN = re.compile(r'^[\s*\-]*(SCORE|REASON|RISK|TARGET)\**:\**\s*(.+?)\s*$', re.M)
+_NUMBER_PATTERN = re.compile(r'\d+(?:\.\d+)?')
 
 class AIAgent:
+    ANALYSIS_CACHE_SIZE = 512
+    GEMINI_MODEL = "gemini-1.5-flash"
+    GEMINI_URL = "https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+    GEMINI_TIMEOUT = 30
+    # Heuristik entscheidet eindeutige Fälle selbst, Gemini nur dazwischen
+    HEURISTIC_REJECT_BELOW = 0.4
+    HEURISTIC_ACCEPT_ABOVE = 0.8
+    
+    PROMPT_TEMPLATE = """Analyze this Solana token for trading:
+
+Token: {name}
+Address: {address}
+Liquidity: ${liquidity:,.2f}
+Volume 24h: ${volume_24h:,.2f}
+Price Change 24h: {price_change_24h:.2f}%
+Holder Count: {holders}
+
+Provide a trading decision:
+- SCORE: 0-100 (confidence to buy)
+- REASON: Brief explanation
+- RISK: LOW/MEDIUM/HIGH
+- TARGET: Expected profit multiplier (e.g., 2x)
+
+Format your response as:
+SCORE: [number]
+REASON: [text]
+RISK: [level]
+TARGET: [multiplier]
+"""
+    
     def __init__(self):
         self._logger = log.bind(module="ai_agent")
-        self.model = None
-        self.enabled = False
-        
-        if GEMINI_AVAILABLE and settings.GEMINI_API_KEY:
-            try:
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                # Use gemini-1.5-flash instead of deprecated gemini-pro
-                self.model = genai.GenerativeModel('gemini-1.5-flash')
-                self.enabled = True
-                self._logger.info("✅ Gemini AI initialized")
-            except Exception as e:
-                self._logger.warning("gemini_init_failed", error=str(e))
+        self.enabled = bool(settings.GEMINI_API_KEY)
+        self.url = self.GEMINI_URL.format(model=self.GEMINI_MODEL)
+        # (address, price, volume) -> result; gleicher Marktzustand = gleiche Antwort
+        self._analysis_cache: Dict[Tuple[str, float, float], Dict] = {}
+        
+        if self.enabled:
+            self._logger.info("✅ Gemini AI initialized", model=self.GEMINI_MODEL)
         else:
-            self._logger.warning("gemini_not_available", 
-                               has_key=bool(settings.GEMINI_API_KEY),
-                               installed=GEMINI_AVAILABLE)
+            self._logger.warning("gemini_not_available", has_key=False)
     
     async def analyze_token(self, 
                           token_address: str,
@@ -40,51 +67,67 @@ class AIAgent:
         
         if not self.enabled:
             # Fallback: Simple heuristic analysis
-            return await self._fallback_analysis(market_data)
+            return self._fallback_analysis(market_data)
+        
+        heuristic = self._heuristic_analysis(market_data)
+        if not (self.HEURISTIC_REJECT_BELOW <= heuristic['confidence'] <= self.HEURISTIC_ACCEPT_ABOVE):
+            self._logger.info("ai_skipped_clear_heuristic",
+                            token=token_name,
+                            confidence=heuristic['confidence'])
+            return heuristic
+        
+        cache_key = (
+            token_address,
+            round(float(market_data.get('price_usd', 0) or 0), 6),
+            round(float(market_data.get('volume_24h', 0) or 0), 0),
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
         
         try:
             prompt = self._build_analysis_prompt(market_data)
+            response_text = await self._generate(prompt)
             
-            # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None, 
-                lambda: self.model.generate_content(prompt)
-            )
+            result = self._parse_response(response_text, market_data)
             
-            return self._parse_response(response.text, market_data)
+            # Keep cache small
+            if len(self._analysis_cache) >= self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.clear()
+            self._analysis_cache[cache_key] = result
+            
+            return result
             
         except Exception as e:
             self._logger.error("ai_analysis_failed", error=str(e))
-            return await self._fallback_analysis(market_data)
+            return self._fallback_analysis(market_data)
+    
+    async def _generate(self, prompt: str) -> str:
+        """Gemini generateContent Request, liefert den Antworttext."""
+        session = await get_session()
+        payload = {"contents": [{"parts": [{"text": prompt}]}]}
+        headers = {"x-goog-api-key": settings.GEMINI_API_KEY}
+        
+        async with session.post(self.url, json=payload, headers=headers, timeout=self.GEMINI_TIMEOUT) as resp:
+            data = loads(await resp.read())
+            if resp.status != 200:
+                raise RuntimeError(f"Gemini HTTP {resp.status}: {data.get('error', {}).get('message')}")
+        
+        return data['candidates'][0]['content']['parts'][0]['text']
     
     def _build_analysis_prompt(self, token_data: Dict) -> str:
         """Build analysis prompt for Gemini"""
-        return f"""Analyze this Solana token for trading:
-
-Token: {token_data.get('name', 'Unknown')}
-Address: {token_data.get('address', 'Unknown')}
-Liquidity: ${token_data.get('liquidity', 0):,.2f}
-Volume 24h: ${token_data.get('volume_24h', 0):,.2f}
-Price Change 24h: {token_data.get('price_change_24h', 0):.2f}%
-Holder Count: {token_data.get('holders', 0)}
-
-Provide a trading decision:
-- SCORE: 0-100 (confidence to buy)
-- REASON: Brief explanation
-- RISK: LOW/MEDIUM/HIGH
-- TARGET: Expected profit multiplier (e.g., 2x)
-
-Format your response as:
-SCORE: [number]
-REASON: [text]
-RISK: [level]
-TARGET: [multiplier]
-"""
+        return self.PROMPT_TEMPLATE.format(
+            name=token_data.get('name', 'Unknown'),
+            address=token_data.get('address', 'Unknown'),
+            liquidity=token_data.get('liquidity') or 0,
+            volume_24h=token_data.get('volume_24h') or 0,
+            price_change_24h=token_data.get('price_change_24h') or 0,
+            holders=token_data.get('holders', 0),
+        )
     
     def _parse_response(self, response_text: str, token_data: Dict) -> Dict:
         """Parse Gemini response into structured data"""
-        lines = response_text.strip().split('\n')
         result = {
             'should_buy': False,
             'confidence': 0.0,
@@ -93,18 +136,23 @@ TARGET: [multiplier]
             'target_multiplier': 2.0
         }
         
-        for line in lines:
-            if line.startswith('SCORE:'):
-                score = int(''.join(filter(str.isdigit, line)))
-                result['confidence'] = score / 100.0
-                result['should_buy'] = score >= 70
-            elif line.startswith('REASON:'):
-                result['reason'] = line.replace('REASON:', '').strip()
-            elif line.startswith('RISK:'):
-                result['risk_level'] = line.replace('RISK:', '').strip()
-            elif line.startswith('TARGET:'):
-                target_str = line.replace('TARGET:', '').strip()
-                result['target_multiplier'] = float(''.join(filter(lambda x: x.isdigit() or x == '.', target_str)))
+        for match in _FIELD_PATTERN.finditer(response_text):
+            field, value = match.groups()
+            if field == 'REASON':
+                result['reason'] = value
+            elif field == 'RISK':
+                result['risk_level'] = value
+            else:
+                # Erste Zahl: "85/100" -> 85, "2.5x" -> 2.5
+                number = _NUMBER_PATTERN.search(value)
+                if number is None:
+                    continue
+                if field == 'SCORE':
+                    score = float(number.group())
+                    result['confidence'] = score / 100.0
+                    result['should_buy'] = score >= 70
+                else:
+                    result['target_multiplier'] = float(number.group())
         
         self._logger.info("ai_analysis_complete", 
                          token=token_data.get('name'),
@@ -113,10 +161,13 @@ TARGET: [multiplier]
         
         return result
     
-    async def _fallback_analysis(self, token_data: Dict) -> Dict:
+    def _fallback_analysis(self, token_data: Dict) -> Dict:
         """Simple heuristic analysis when AI is unavailable"""
         self._logger.info("using_fallback_analysis", token=token_data.get('name'))
-        
+        return self._heuristic_analysis(token_data)
+    
+    def _heuristic_analysis(self, token_data: Dict) -> Dict:
+        """Liquidity/Volume/Price/Holder Score ohne externe Calls."""
         score = 0
         
         # Check liquidity
@@ -1,72 +1,126 @@
 """DexScreener API Integration - Real-time token data."""
 
 import asyncio
-from typing import Dict, Optional
+import heapq
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 import aiohttp
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 
+_EMPTY: Dict = {}  # read-only Default für fehlende Sub-Objekte
+
+
+def _liquidity_usd(pair: Dict) -> float:
+    """Pair liquidity in USD (fehlend/null -> 0)."""
+    return float((pair.get('liquidity') or {}).get('usd') or 0)
+
+
 class DexScreenerClient:
     BASE_URL = "https://api.dexscreener.com/latest/dex"
+    MAX_BATCH_SIZE = 30  # Max Adressen pro /tokens Request
+    TOKEN_CACHE_TTL = 15.0  # Sekunden - kürzer als Loop-Intervall
+    TOKEN_CACHE_MAXSIZE = 10_000  # LRU Eviction darüber
+    MAX_CONCURRENT_REQUESTS = 8  # Mehr parallele GETs = nur mehr 429s
+    
+    # Trending Filter
+    SKIP_NAME_PARTS = ('sol', 'usdt', 'usdc')  # bekannte Tokens, keine Memecoins
+    PUMPFUN_DEX_IDS = frozenset({'pumpfun', 'pump.fun', 'pumpswap'})
     
     def __init__(self):
         self._logger = log.bind(module="dexscreener")
         self.session: Optional[aiohttp.ClientSession] = None
+        # address -> (expiry monotonic, parsed token data), LRU Reihenfolge
+        self._token_cache: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        # URL -> laufender Request (gleichzeitige Caller teilen ihn)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._request_slots = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+    
+    def _cache_get(self, token_address: str) -> Optional[Dict]:
+        """Return cached token data if still fresh."""
+        entry = self._token_cache.get(token_address)
+        if entry is None:
+            return None
+        expiry, parsed = entry
+        if time.monotonic() >= expiry:
+            del self._token_cache[token_address]
+            return None
+        self._token_cache.move_to_end(token_address)
+        return parsed
+    
+    def _cache_put(self, token_address: str, parsed: Dict):
+        self._token_cache[token_address] = (time.monotonic() + self.TOKEN_CACHE_TTL, parsed)
+        self._token_cache.move_to_end(token_address)
+        while len(self._token_cache) > self.TOKEN_CACHE_MAXSIZE:
+            self._token_cache.popitem(last=False)
     
     async def _ensure_session(self):
-        """Ensure aiohttp session exists"""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Ensure aiohttp session exists (shared pooled session)"""
+        if not self.session or self.session.closed:
+            self.session = await get_session()
     
     async def close(self):
-        """Close aiohttp session"""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release session (shared session is closed via close_session())"""
+        self.session = None
     
-    async def get_token_data(self, token_address: str) -> Optional[Dict]:
-        """Get token data from DexScreener"""
+    async def _get_json(self, url: str, timeout: float = 10) -> Tuple[int, Optional[Dict]]:
+        """GET url -> (status, JSON body oder None bei status != 200).
+        
+        Max MAX_CONCURRENT_REQUESTS gleichzeitig; identische URLs die
+        bereits laufen werden nicht erneut angefragt (Single-Flight).
+        Exceptions (Timeout, Netzwerk) gehen an alle wartenden Caller.
+        """
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.ensure_future(self._request_json(url, timeout))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        
+        # shield: Abbruch eines Callers bricht nicht den geteilten Request ab
+        return await asyncio.shield(task)
+    
+    async def _request_json(self, url: str, timeout: float) -> Tuple[int, Optional[Dict]]:
         await self._ensure_session()
+        async with self._request_slots:
+            async with self.session.get(url, timeout=timeout) as response:
+                if response.status != 200:
+                    return response.status, None
+                return response.status, loads(await response.read())
+    
+    async def get_token_data(self, token_address: str) -> Optional[Dict]:
+        """Get token data from DexScreener (cached for TOKEN_CACHE_TTL)"""
+        cached = self._cache_get(token_address)
+        if cached is not None:
+            return cached
         
         try:
             url = f"{self.BASE_URL}/tokens/{token_address}"
+            status, data = await self._get_json(url)
             
-            async with self.session.get(url, timeout=10) as response:
-                if response.status != 200:
-                    self._logger.warning("dexscreener_error", 
-                                       status=response.status,
-                                       token=token_address)
-                    return None
-                
-                data = await response.json()
-                
-                if not data or 'pairs' not in data or not data['pairs']:
-                    self._logger.warning("no_pairs_found", token=token_address)
-                    return None
-                
-                # Get the pair with highest liquidity
-                pair = max(data['pairs'], key=lambda p: float(p.get('liquidity', {}).get('usd', 0)))
-                
-                parsed = {
-                    'address': token_address,
-                    'name': pair.get('baseToken', {}).get('name', 'Unknown'),
-                    'symbol': pair.get('baseToken', {}).get('symbol', 'Unknown'),
-                    'price_usd': float(pair.get('priceUsd', 0)),
-                    'liquidity': float(pair.get('liquidity', {}).get('usd', 0)),
-                    'volume_24h': float(pair.get('volume', {}).get('h24', 0)),
-                    'price_change_24h': float(pair.get('priceChange', {}).get('h24', 0)),
-                    'price_change_1h': float(pair.get('priceChange', {}).get('h1', 0)),
-                    'txns_24h': pair.get('txns', {}).get('h24', {}),
-                    'dex': pair.get('dexId', 'unknown'),
-                    'pair_address': pair.get('pairAddress', ''),
-                }
-                
-                self._logger.info("token_data_fetched",
-                                token=parsed['name'],
-                                liquidity=parsed['liquidity'],
-                                volume=parsed['volume_24h'])
-                
-                return parsed
+            if status != 200:
+                self._logger.warning("dexscreener_error", 
+                                   status=status,
+                                   token=token_address)
+                return None
+            
+            if not data or 'pairs' not in data or not data['pairs']:
+                self._logger.warning("no_pairs_found", token=token_address)
+                return None
+            
+            # Get the pair with highest liquidity
+            pair = max(data['pairs'], key=_liquidity_usd)
+            parsed = self._parse_pair(token_address, pair)
+            self._cache_put(token_address, parsed)
+            
+            self._logger.info("token_data_fetched",
+                            token=parsed['name'],
+                            liquidity=parsed['liquidity'],
+                            volume=parsed['volume_24h'])
+            
+            return parsed
                 
         except asyncio.TimeoutError:
             self._logger.error("dexscreener_timeout", token=token_address)
@@ -75,19 +129,104 @@ class DexScreenerClient:
             self._logger.error("dexscreener_exception", error=str(e), token=token_address)
             return None
     
-    async def search_tokens(self, query: str) -> list:
-        """Search for tokens by name or symbol"""
-        await self._ensure_session()
+    async def get_tokens_batch(self, token_addresses: List[str]) -> Dict[str, Dict]:
+        """Get token data for multiple tokens with one request per 30 tokens.
         
-        try:
-            url = f"{self.BASE_URL}/search?q={query}"
+        DexScreener akzeptiert bis zu 30 komma-getrennte Adressen. Die
+        Chunk-Requests laufen parallel (1x RTT statt 1x RTT pro Chunk).
+        
+        Args:
+            token_addresses: Solana token addresses
             
-            async with self.session.get(url, timeout=10) as response:
-                if response.status != 200:
-                    return []
-                
-                data = await response.json()
-                return data.get('pairs', [])
+        Returns:
+            Dict address -> parsed token data (fehlende Tokens nicht enthalten)
+        """
+        results: Dict[str, Dict] = {}
+        addresses = []
+        for address in dict.fromkeys(a for a in token_addresses if a):
+            cached = self._cache_get(address)
+            if cached is not None:
+                results[address] = cached
+            else:
+                addresses.append(address)
+        
+        if not addresses:
+            return results
+        
+        chunks = [
+            addresses[i:i + self.MAX_BATCH_SIZE]
+            for i in range(0, len(addresses), self.MAX_BATCH_SIZE)
+        ]
+        for fetched in await asyncio.gather(*(self._fetch_chunk(c) for c in chunks)):
+            results.update(fetched)
+        
+        self._logger.info("token_batch_fetched",
+                        requested=len(addresses),
+                        found=len(results))
+        
+        return results
+    
+    async def _fetch_chunk(self, chunk: List[str]) -> Dict[str, Dict]:
+        """Fetch one batch request (max MAX_BATCH_SIZE tokens); errors -> {}."""
+        url = f"{self.BASE_URL}/tokens/{','.join(chunk)}"
+        
+        try:
+            status, data = await self._get_json(url)
+            if status != 200:
+                self._logger.warning("dexscreener_batch_error",
+                                   status=status,
+                                   tokens=len(chunk))
+                return {}
+        except asyncio.TimeoutError:
+            self._logger.error("dexscreener_batch_timeout", tokens=len(chunk))
+            return {}
+        except Exception as e:
+            self._logger.error("dexscreener_batch_exception", error=str(e), tokens=len(chunk))
+            return {}
+        
+        # Bin pairs by base token, keep highest liquidity pair
+        wanted = set(chunk)
+        best: Dict[str, Tuple[float, Dict]] = {}
+        for pair in (data or {}).get('pairs') or []:
+            address = (pair.get('baseToken') or {}).get('address')
+            if address not in wanted:
+                continue
+            liquidity = _liquidity_usd(pair)
+            current = best.get(address)
+            if current is None or liquidity > current[0]:
+                best[address] = (liquidity, pair)
+        
+        results = {}
+        for address, (_, pair) in best.items():
+            parsed = self._parse_pair(address, pair)
+            self._cache_put(address, parsed)
+            results[address] = parsed
+        return results
+    
+    def _parse_pair(self, token_address: str, pair: Dict) -> Dict:
+        """Parse DexScreener pair into standardized token data."""
+        base = pair.get('baseToken') or {}
+        price_change = pair.get('priceChange') or {}
+        return {
+            'address': token_address,
+            'name': base.get('name', 'Unknown'),
+            'symbol': base.get('symbol', 'Unknown'),
+            'price_usd': float(pair.get('priceUsd') or 0),
+            'liquidity': _liquidity_usd(pair),
+            'volume_24h': float((pair.get('volume') or {}).get('h24') or 0),
+            'price_change_24h': float(price_change.get('h24') or 0),
+            'price_change_1h': float(price_change.get('h1') or 0),
+            'txns_24h': pair.get('txns', {}).get('h24', {}),
+            'dex': pair.get('dexId', 'unknown'),
+            'pair_address': pair.get('pairAddress', ''),
+        }
+    
+    async def search_tokens(self, query: str, timeout: float = 10) -> list:
+        """Search for tokens by name or symbol"""
+        try:
+            url = f"{self.BASE_URL}/search?q={quote_plus(query)}"
+            _, data = await self._get_json(url, timeout=timeout)
+            return (data or {}).get('pairs') or []
                 
         except Exception as e:
             self._logger.error("search_failed", error=str(e))
@@ -101,8 +240,6 @@ class DexScreenerClient:
         Returns:
             List of token addresses (echte Memecoins!)
         """
-        await self._ensure_session()
-        
         try:
             # DexScreener: Search mit "pump" filter für Memecoins
             queries = [
@@ -112,19 +249,12 @@ class DexScreenerClient:
                 "inu",
                 "pepe",
             ]
-            endpoints = [f"{self.BASE_URL}/search?q={quote_plus(q)}" for q in queries]
-            
-            all_pairs = []
             
-            for endpoint in endpoints:
-                try:
-                    async with self.session.get(endpoint, timeout=5) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            pairs = data.get('pairs', [])
-                            all_pairs.extend(pairs)
-                except:
-                    continue
+            # Alle Queries parallel (1x RTT statt 5x)
+            results = await asyncio.gather(
+                *(self.search_tokens(q, timeout=5) for q in queries)
+            )
+            all_pairs = [pair for pairs in results for pair in pairs]
             
             if not all_pairs:
                 self._logger.warning("no_memecoin_pairs_found")
@@ -139,38 +269,35 @@ class DexScreenerClient:
                 if pair.get('chainId') != 'solana':
                     continue
                 
-                name = pair.get('baseToken', {}).get('name', '').lower()
-                symbol = pair.get('baseToken', {}).get('symbol', '').lower()
-                liquidity = float(pair.get('liquidity', {}).get('usd', 0))
-                volume_24h = float(pair.get('volume', {}).get('h24', 0))
-                token_address = pair.get('baseToken', {}).get('address')
-
-                url = (pair.get('url') or '').lower()
-                dex_id = (pair.get('dexId') or '').lower()
-                labels = pair.get('labels') or []
-                labels_lower = [str(l).lower() for l in labels]
-
-                is_pumpfun = (
-                    'pump.fun' in url
-                    or dex_id in {'pumpfun', 'pump.fun', 'pumpswap'}
-                    or any('pumpfun' in l or 'pump.fun' in l for l in labels_lower)
-                )
+                base = pair.get('baseToken') or {}
+                token_address = base.get('address')
+                if not token_address or token_address in seen_addresses:
+                    continue
                 
                 # Skip bekannte tokens
-                skip_names = ['sol', 'usdt', 'usdc']
-                if any(skip in name for skip in skip_names):
+                name = (base.get('name') or '').lower()
+                if any(skip in name for skip in self.SKIP_NAME_PARTS):
                     continue
                 
+                liquidity = float((pair.get('liquidity') or _EMPTY).get('usd') or 0)
+                volume_24h = float((pair.get('volume') or _EMPTY).get('h24') or 0)
+                
                 # Memecoin criteria
-                if (liquidity >= 5000 and 
-                    volume_24h >= 500 and 
-                    token_address and 
-                    token_address not in seen_addresses):
+                if liquidity >= 5000 and volume_24h >= 500:
+                    symbol = base.get('symbol') or ''
+                    is_pumpfun = (
+                        'pump.fun' in (pair.get('url') or '').lower()
+                        or (pair.get('dexId') or '').lower() in self.PUMPFUN_DEX_IDS
+                        or any(
+                            'pumpfun' in l or 'pump.fun' in l
+                            for l in map(str.lower, map(str, pair.get('labels') or ()))
+                        )
+                    )
                     
                     seen_addresses.add(token_address)
                     memecoin_candidates.append({
                         'address': token_address,
-                        'name': pair.get('baseToken', {}).get('name'),
+                        'name': base.get('name'),
                         'symbol': symbol.upper(),
                         'liquidity': liquidity,
                         'volume': volume_24h,
@@ -178,16 +305,16 @@ class DexScreenerClient:
                     })
                     
                     self._logger.info("🎯 memecoin_found",
-                                    name=pair.get('baseToken', {}).get('name'),
+                                    name=base.get('name'),
                                     symbol=symbol.upper(),
-                                    liquidity=f"${liquidity:,.0f}",
-                                    volume=f"${volume_24h:,.0f}",
+                                    liquidity_usd=round(liquidity),
+                                    volume_usd=round(volume_24h),
                                     pumpfun=is_pumpfun)
             
-            # Sort by score (volume, with slight pump.fun boost)
-            memecoin_candidates.sort(key=lambda x: x['score'], reverse=True)
+            # Top by score (volume, with slight pump.fun boost)
+            top = heapq.nlargest(limit, memecoin_candidates, key=lambda x: x['score'])
             
-            return [m['address'] for m in memecoin_candidates[:limit]]
+            return [m['address'] for m in top]
                 
         except Exception as e:
             self._logger.error("trending_memecoins_error", error=str(e))
@@ -7,6 +7,9 @@ import asyncio
 from typing import Dict, Optional, List
 import aiohttp
 from datetime import datetime
+from src.core.cache import async_ttl_cache
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 
 
@@ -15,21 +18,38 @@ class GMGNClient:
     
     BASE_URL = "https://gmgn.ai/defi/quotation/v1"
     CHAIN = "sol"  # Solana
+    # Geteilte Session hat keine Default-Header → einmal pro Klasse statt pro Call
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0",
+        "Accept": "application/json",
+    }
+    
+    # (GMGN Feld, Ausgabe-Feld, Konverter) für get_token_data
+    NUMERIC_FIELDS = (
+        ('price', 'price_usd', float),
+        ('liquidity', 'liquidity', float),
+        ('liquidity', 'liquidity_usd', float),
+        ('volume_24h', 'volume_24h', float),
+        ('price_change_24h', 'price_change_24h', float),
+        ('price_change_1h', 'price_change_1h', float),
+        ('market_cap', 'market_cap', float),
+        ('holder_count', 'holders', int),
+        ('buy_24h', 'buy_count_24h', int),
+        ('sell_24h', 'sell_count_24h', int),
+    )
     
     def __init__(self):
         self._logger = log.bind(module="gmgn")
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def _ensure_session(self):
-        """Ensure aiohttp session exists."""
-        if not self.session:
-            self.session = aiohttp.ClientSession()
+        """Ensure aiohttp session exists (shared pooled session)"""
+        if not self.session or self.session.closed:
+            self.session = await get_session()
     
     async def close(self):
-        """Close aiohttp session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Release session (shared session is closed via close_session())"""
+        self.session = None
     
     async def get_trending_tokens(self, limit: int = 10) -> List[Dict]:
         """Get trending Solana tokens from GMGN.
@@ -40,43 +60,40 @@ class GMGNClient:
         Returns:
             List of token data dicts
         """
-        await self._ensure_session()
-        
         try:
-            # GMGN trending endpoint
-            url = f"{self.BASE_URL}/tokens/top_gainers/{self.CHAIN}"
-            params = {
-                "limit": limit,
-                "orderby": "volume_24h",  # Sort by 24h volume
-            }
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0",
-                "Accept": "application/json",
-            }
-            
-            async with self.session.get(url, params=params, headers=headers, timeout=10) as response:
-                if response.status != 200:
-                    self._logger.warning("gmgn_error", status=response.status)
-                    return []
-                
-                data = await response.json()
-                
-                if not data or 'data' not in data:
-                    self._logger.warning("gmgn_no_data")
-                    return []
-                
-                tokens = data['data'].get('tokens', [])
-                
-                self._logger.info("gmgn_trending_fetched", count=len(tokens))
-                return tokens[:limit]
-                
+            return await self._fetch_trending_tokens(limit)
         except asyncio.TimeoutError:
             self._logger.error("gmgn_timeout")
-            return []
         except Exception as e:
             self._logger.error("gmgn_exception", error=str(e))
-            return []
+        return []
+    
+    @async_ttl_cache(ttl=15.0, maxsize=16)
+    async def _fetch_trending_tokens(self, limit: int) -> List[Dict]:
+        """Trending Request - Fehler propagieren, damit sie nicht gecached werden."""
+        await self._ensure_session()
+        
+        # GMGN trending endpoint
+        url = f"{self.BASE_URL}/tokens/top_gainers/{self.CHAIN}"
+        params = {
+            "limit": limit,
+            "orderby": "volume_24h",  # Sort by 24h volume
+        }
+        
+        async with self.session.get(url, params=params, headers=self.HEADERS, timeout=10) as response:
+            if response.status != 200:
+                raise RuntimeError(f"GMGN HTTP {response.status}")
+            
+            data = loads(await response.read())
+            
+            if not data or 'data' not in data:
+                self._logger.warning("gmgn_no_data")
+                return []
+            
+            tokens = data['data'].get('tokens', [])
+            
+            self._logger.info("gmgn_trending_fetched", count=len(tokens))
+            return tokens[:limit]
     
     async def get_token_data(self, token_address: str) -> Optional[Dict]:
         """Get detailed token data from GMGN.
@@ -87,63 +104,53 @@ class GMGNClient:
         Returns:
             Parsed token data or None
         """
-        await self._ensure_session()
-        
         try:
-            url = f"{self.BASE_URL}/tokens/{self.CHAIN}/{token_address}"
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0",
-                "Accept": "application/json",
-            }
-            
-            async with self.session.get(url, headers=headers, timeout=10) as response:
-                if response.status != 200:
-                    self._logger.warning("gmgn_token_error", 
-                                       status=response.status,
-                                       token=token_address)
-                    return None
-                
-                data = await response.json()
-                
-                if not data or 'data' not in data:
-                    self._logger.warning("gmgn_no_token_data", token=token_address)
-                    return None
-                
-                token = data['data']
-                
-                # Parse to standardized format
-                parsed = {
-                    'address': token_address,
-                    'name': token.get('name', 'Unknown'),
-                    'symbol': token.get('symbol', 'Unknown'),
-                    'price_usd': float(token.get('price', 0)),
-                    'liquidity': float(token.get('liquidity', 0)),
-                    'liquidity_usd': float(token.get('liquidity', 0)),
-                    'volume_24h': float(token.get('volume_24h', 0)),
-                    'price_change_24h': float(token.get('price_change_24h', 0)),
-                    'price_change_1h': float(token.get('price_change_1h', 0)),
-                    'market_cap': float(token.get('market_cap', 0)),
-                    'holders': int(token.get('holder_count', 0)),
-                    'created_at': token.get('created_timestamp', 0),
-                    'is_verified': token.get('is_show_alert', False) == False,
-                    'buy_count_24h': int(token.get('buy_24h', 0)),
-                    'sell_count_24h': int(token.get('sell_24h', 0)),
-                }
-                
-                self._logger.info("gmgn_token_fetched",
-                                token=parsed['name'],
-                                price=parsed['price_usd'],
-                                liquidity=parsed['liquidity'])
-                
-                return parsed
-                
+            return await self._fetch_token_data(token_address)
         except asyncio.TimeoutError:
             self._logger.error("gmgn_token_timeout", token=token_address)
-            return None
         except Exception as e:
             self._logger.error("gmgn_token_exception", error=str(e), token=token_address)
-            return None
+        return None
+    
+    @async_ttl_cache(ttl=10.0, maxsize=10_000)
+    async def _fetch_token_data(self, token_address: str) -> Optional[Dict]:
+        """Token Request - Fehler propagieren, damit sie nicht gecached werden."""
+        await self._ensure_session()
+        
+        url = f"{self.BASE_URL}/tokens/{self.CHAIN}/{token_address}"
+        
+        async with self.session.get(url, headers=self.HEADERS, timeout=10) as response:
+            if response.status != 200:
+                raise RuntimeError(f"GMGN HTTP {response.status}")
+            
+            data = loads(await response.read())
+            
+            if not data or 'data' not in data:
+                self._logger.warning("gmgn_no_token_data", token=token_address)
+                return None
+            
+            token = data['data']
+            
+            # Parse to standardized format
+            token_get = token.get
+            parsed = {
+                'address': token_address,
+                'name': token_get('name', 'Unknown'),
+                'symbol': token_get('symbol', 'Unknown'),
+                'created_at': token_get('created_timestamp', 0),
+                'is_verified': token_get('is_show_alert', False) == False,
+            }
+            parsed.update({
+                out: convert(token_get(key, 0))
+                for key, out, convert in self.NUMERIC_FIELDS
+            })
+            
+            self._logger.info("gmgn_token_fetched",
+                            token=parsed['name'],
+                            price=parsed['price_usd'],
+                            liquidity=parsed['liquidity'])
+            
+            return parsed
     
     async def get_new_tokens(self, hours: int = 1, min_liquidity: float = 5000) -> List[Dict]:
         """Get newly created tokens (insider advantage).
@@ -164,16 +171,11 @@ class GMGNClient:
                 "min_liquidity": min_liquidity,
             }
             
-            headers = {
-                "User-Agent": "Mozilla/5.0",
-                "Accept": "application/json",
-            }
-            
-            async with self.session.get(url, params=params, headers=headers, timeout=10) as response:
+            async with self.session.get(url, params=params, headers=self.HEADERS, timeout=10) as response:
                 if response.status != 200:
                     return []
                 
-                data = await response.json()
+                data = loads(await response.read())
                 tokens = data.get('data', {}).get('tokens', [])
                 
                 self._logger.info("gmgn_new_tokens_fetched", count=len(tokens))
@@ -1,12 +1,19 @@
 import asyncio
-from typing import Optional, Dict
+import base64
+import time
+from typing import Optional, Dict, List
 import inspect
 import httpx
+import numpy as np
 from solana.rpc.async_api import AsyncClient
 from solana.rpc import commitment
 from solana.rpc.providers import async_http
-from solders.pubkey import Pubkey
+from solders.hash import Hash
+from src.blockchain.utils import to_pubkey
+from src.core.cache import async_ttl_cache
 from src.core.config import settings
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 
 
@@ -33,10 +40,24 @@ def _ensure_httpx_proxy_compat() -> None:
         # If anything goes wrong, don't crash the client initialization here.
         return
 
+def _parse_rpc_urls() -> List[str]:
+    """Primary RPC + SOLANA_RPC_URLS (dedupliziert, Reihenfolge bleibt)."""
+    extra = (settings.SOLANA_RPC_URLS or "").split(",")
+    return list(dict.fromkeys(u.strip() for u in [settings.SOLANA_RPC_URL, *extra] if u.strip()))
+
+
 class SolanaClient:
+    PRIORITY_FEE_PERCENTILE = 95
+    MAX_PRIORITY_FEE = 1_000_000  # micro-lamports per CU
+    BLOCKHASH_TTL_S = 3.0  # Blockhash bleibt ~60s gültig, 3s alt ist unkritisch
+    BLOCKHASH_REFRESH_S = 2.0  # < TTL: Send-Pfad trifft immer den warmen Cache
+
     def __init__(self):
         self.rpc_url = settings.SOLANA_RPC_URL
+        self.rpc_urls = _parse_rpc_urls()
         self.client: Optional[AsyncClient] = None
+        self._blockhash: Optional[Hash] = None
+        self._blockhash_at: float = 0.0
         self._logger = log.bind(module="blockchain_client")
 
     async def connect(self):
@@ -59,11 +80,114 @@ class SolanaClient:
         if not self.client:
             await self.connect()
         try:
-            pubkey = Pubkey.from_string(pubkey_str)
+            pubkey = to_pubkey(pubkey_str)
             response = await self.client.get_balance(pubkey)
             return response.value / 1_000_000_000
         except Exception as e:
             self._logger.error("Balance Error", error=str(e))
             return 0.0
 
+    async def get_latest_blockhash(self) -> Hash:
+        """Recent Blockhash (gecached für BLOCKHASH_TTL_S).
+
+        Returns:
+            Blockhash (commitment: confirmed)
+        """
+        if self._blockhash is not None and time.monotonic() - self._blockhash_at < self.BLOCKHASH_TTL_S:
+            return self._blockhash
+
+        if not self.client:
+            await self.connect()
+        response = await self.client.get_latest_blockhash(commitment.Confirmed)
+        self._blockhash = response.value.blockhash
+        self._blockhash_at = time.monotonic()
+        return self._blockhash
+
+    async def refresh_blockhash_loop(self):
+        """Hält den Blockhash Cache warm, damit der Send-Pfad nie wartet."""
+        while True:
+            try:
+                self._blockhash_at = 0.0
+                await self.get_latest_blockhash()
+            except Exception as e:
+                self._logger.warning("blockhash_refresh_error", error=str(e))
+            await asyncio.sleep(self.BLOCKHASH_REFRESH_S)
+
+    async def _rpc(self, url: str, method: str, params: list, timeout: float = 10):
+        """Raw JSON-RPC call über die geteilte HTTP Session."""
+        session = await get_session()
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        async with session.post(url, json=payload, timeout=timeout) as resp:
+            data = loads(await resp.read())
+        if "error" in data:
+            raise RuntimeError(data["error"].get("message", str(data["error"])))
+        return data.get("result")
+
+    async def get_priority_fee(self) -> int:
+        """Schätze Compute Unit Price aus getRecentPrioritizationFees.
+
+        Returns:
+            p95 der letzten Slots in micro-lamports
+            (settings.PRIORITY_FEE_MICROLAMPORTS bei Fehler / ohne Daten)
+        """
+        try:
+            return await self._fetch_priority_fee()
+        except Exception as e:
+            self._logger.warning("priority_fee_error", error=str(e))
+            return settings.PRIORITY_FEE_MICROLAMPORTS
+
+    @async_ttl_cache(ttl=5.0, maxsize=4)
+    async def _fetch_priority_fee(self) -> int:
+        """Gecached für 5s - mehrere Swaps pro Slot-Fenster teilen einen Call.
+
+        RPC Fehler propagieren, damit der Fallback nicht im Cache landet.
+        """
+        result = await self._rpc(self.rpc_url, "getRecentPrioritizationFees", [])
+
+        fees = [entry["prioritizationFee"] for entry in result or []]
+        if not fees:
+            return settings.PRIORITY_FEE_MICROLAMPORTS
+
+        fee = int(np.percentile(fees, self.PRIORITY_FEE_PERCENTILE))
+        return min(fee, self.MAX_PRIORITY_FEE)
+
+    async def send_raw_transaction(self, txn: bytes, skip_preflight: bool = True) -> str:
+        """Sende signierte Transaktion parallel an alle RPCs.
+
+        Die erste erfolgreiche Antwort gewinnt, restliche Requests
+        werden abgebrochen.
+
+        Args:
+            txn: Serialisierte, signierte Transaktion
+            skip_preflight: False = RPC simuliert vorher, fehlschlagende
+                Transaktionen werden abgelehnt statt Fees zu kosten
+
+        Returns:
+            Transaction Signature
+
+        Raises:
+            RuntimeError: Wenn alle RPCs fehlschlagen
+        """
+        encoded = base64.b64encode(txn).decode()
+        params = [encoded, {"encoding": "base64", "skipPreflight": skip_preflight}]
+
+        pending = {
+            asyncio.create_task(self._rpc(url, "sendTransaction", params))
+            for url in self.rpc_urls
+        }
+        errors = []
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    errors.append(str(task.exception()))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        self._logger.error("send_transaction_failed", rpcs=len(self.rpc_urls), errors=errors)
+        raise RuntimeError(f"All RPCs failed: {errors}")
+
 solana_client = SolanaClient()
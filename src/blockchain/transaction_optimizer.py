@@ -9,7 +9,8 @@ Macht Transaktionen schneller durch:
 
 import os
 import asyncio
-from typing import Optional, List
+import time
+from typing import Dict, Optional, List
 from dataclasses import dataclass
 
 import aiohttp
@@ -18,13 +19,21 @@ from solana.rpc.commitment import Confirmed, Finalized
 from solders.compute_budget import set_compute_unit_limit, set_compute_unit_price
 from solders.transaction import Transaction
 from solders.message import Message
+from solders.signature import Signature
 from solders.instruction import Instruction
+from solders.transaction_status import TransactionConfirmationStatus
 
+from src.blockchain.client import solana_client
+from src.blockchain.ws_hub import ws_hub
 from src.core.logger import log
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.eventloop import loop_name
+from src.core.http import close_session, get_session
+from src.core.jsonutil import dumps, loads
 
 
-@dataclass
+@dataclass(slots=True)
 class RPCEndpoint:
     """RPC Endpoint mit Performance-Metriken."""
     url: str
@@ -54,6 +63,26 @@ class TransactionOptimizer:
         "https://tokyo.mainnet.block-engine.jito.wtf",
     ]
     
+    # Max gleichzeitige Latenz-Probes (Connector / Rate Limits)
+    PROBE_CONCURRENCY = 8
+    HEALTH_PAYLOAD = {"jsonrpc": "2.0", "id": 1, "method": "getHealth"}
+    JSON_HEADERS = {"Content-Type": "application/json"}
+    
+    # Netzwerk Priority Fee: Neuabfrage nach FEE_TTL_S
+    FEE_TTL_S = 5.0
+    
+    # RPC Ranking: Neumessung nach RANK_TTL_S, Gewicht neuer Messungen
+    RANK_TTL_S = 30.0
+    LATENCY_EWMA_ALPHA = 0.3
+    
+    # Gemeinsames Status-Polling neben signatureSubscribe
+    STATUS_POLL_INTERVAL_S = 0.4
+    MAX_STATUS_BATCH = 256  # Limit von getSignatureStatuses
+    CONFIRMED_STATUSES = (
+        TransactionConfirmationStatus.Confirmed,
+        TransactionConfirmationStatus.Finalized,
+    )
+    
     def __init__(
         self,
         use_jito: bool = True,
@@ -70,28 +99,60 @@ class TransactionOptimizer:
         self.priority_fee_lamports = priority_fee_lamports
         self.compute_units = compute_units
         
-        self.current_endpoint_idx = 0
         self.session: Optional[aiohttp.ClientSession] = None
+        self._probe_slots = asyncio.Semaphore(self.PROBE_CONCURRENCY)
+        self._ranking: List[RPCEndpoint] = []
+        self._ranked_at: Optional[float] = None
+        self._ranking_task: Optional[asyncio.Task] = None
+        self._pending: Dict[str, asyncio.Future] = {}  # signature -> (status, err)
+        self._status_task: Optional[asyncio.Task] = None
+        self._network_fee = 0  # micro-lamports/CU aus getRecentPrioritizationFees
+        self._fee_at: Optional[float] = None
+        self._fee_task: Optional[asyncio.Task] = None
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
     
     async def __aexit__(self, *args):
-        if self.session:
-            await self.session.close()
+        # Geteilte Session bleibt offen (Keep-Alive für den nächsten Trade)
+        self.session = None
+    
+    async def _ensure_session(self):
+        """Nutze die prozessweite HTTP Session (kein TLS Handshake pro Send)."""
+        if self.session is None or self.session.closed:
+            self.session = await get_session()
     
     def get_priority_instructions(self) -> List[Instruction]:
         """Erstelle Priority Fee Instructions.
         
+        Fee = max(priority_fee_lamports, aktuelle Netzwerk-Fee). Die
+        Netzwerk-Fee wird nach FEE_TTL_S im Hintergrund neu geholt.
+        
         Returns:
             List mit Compute Budget Instructions
         """
+        if self._fee_at is None or time.monotonic() - self._fee_at >= self.FEE_TTL_S:
+            self._refresh_priority_fee()
+        
         return [
             set_compute_unit_limit(self.compute_units),
-            set_compute_unit_price(self.priority_fee_lamports),
+            set_compute_unit_price(max(self.priority_fee_lamports, self._network_fee)),
         ]
     
+    def _refresh_priority_fee(self):
+        """Starte eine Fee-Abfrage (nur mit laufendem Loop, höchstens eine)."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._fee_task is None or self._fee_task.done():
+            self._fee_task = asyncio.create_task(self._update_network_fee())
+    
+    async def _update_network_fee(self):
+        self._network_fee = await solana_client.get_priority_fee()
+        self._fee_at = time.monotonic()
+    
     def add_priority_fee(self, instructions: List[Instruction]) -> List[Instruction]:
         """Füge Priority Fee zu bestehenden Instructions hinzu.
         
@@ -107,60 +168,85 @@ class TransactionOptimizer:
     async def get_fastest_rpc(self) -> str:
         """Finde schnellsten RPC Endpoint.
         
+        Ranking nach EWMA der gemessenen Latenz, gecached für RANK_TTL_S.
+        Ist es veraltet, wird im Hintergrund neu gemessen - der Aufrufer
+        bekommt sofort das bisherige Ergebnis.
+        
         Returns:
             URL des schnellsten Endpoints
         """
-        if not self.session:
+        if self._ranked_at is None:
+            await self._refresh_ranking()
+        elif time.monotonic() - self._ranked_at >= self.RANK_TTL_S:
+            self._refresh_ranking()
+        
+        if not self._ranking:
             return self.RPC_ENDPOINTS[0].url
+        return self._ranking[0].url
+    
+    def _refresh_ranking(self) -> asyncio.Task:
+        """Starte eine Neumessung (höchstens eine gleichzeitig)."""
+        if self._ranking_task is None or self._ranking_task.done():
+            self._ranking_task = asyncio.create_task(self._rank_endpoints())
+        return self._ranking_task
+    
+    async def _rank_endpoints(self):
+        """Alle Endpoints proben, EWMA aktualisieren und sortieren."""
+        await self._ensure_session()
         
-        tasks = []
-        for endpoint in self.RPC_ENDPOINTS:
-            tasks.append(self._test_rpc_latency(endpoint))
+        results = await asyncio.gather(
+            *(self._test_rpc_latency(endpoint) for endpoint in self.RPC_ENDPOINTS),
+            return_exceptions=True,
+        )
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Fehlgeschlagene Probes (inf) fallen aus dem Ranking
+        ranking = []
+        for endpoint, latency in zip(self.RPC_ENDPOINTS, results):
+            if not isinstance(latency, float) or latency == float('inf'):
+                continue
+            if endpoint.avg_latency_ms:
+                latency = (1 - self.LATENCY_EWMA_ALPHA) * endpoint.avg_latency_ms + self.LATENCY_EWMA_ALPHA * latency
+            endpoint.avg_latency_ms = latency
+            ranking.append(endpoint)
         
-        # Sortiere nach Latenz
-        valid_endpoints = [
-            (endpoint, latency)
-            for endpoint, latency in zip(self.RPC_ENDPOINTS, results)
-            if isinstance(latency, float)
-        ]
+        ranking.sort(key=lambda endpoint: endpoint.avg_latency_ms)
+        self._ranking = ranking
+        self._ranked_at = time.monotonic()
         
-        if not valid_endpoints:
+        if ranking:
+            log.info("fastest_rpc_found", url=ranking[0].url, latency_ms=ranking[0].avg_latency_ms)
+        else:
             log.warning("all_rpcs_failed", fallback=self.RPC_ENDPOINTS[0].url)
-            return self.RPC_ENDPOINTS[0].url
-        
-        fastest = min(valid_endpoints, key=lambda x: x[1])
-        log.info("fastest_rpc_found", url=fastest[0].url, latency_ms=fastest[1])
-        
-        return fastest[0].url
     
-    async def _test_rpc_latency(self, endpoint: RPCEndpoint) -> float:
+    async def _test_rpc_latency(self, endpoint: RPCEndpoint, deep: bool = False) -> float:
         """Teste RPC Latenz mit getHealth.
         
+        Gemessen wird bis zu den Response-Headern über die Keep-Alive
+        Verbindung der geteilten Session - ohne JSON Decode. ``deep=True``
+        prüft zusätzlich, dass der Node "ok" meldet.
+        
         Returns:
-            Latenz in Millisekunden
+            Latenz in Millisekunden (inf bei Fehler)
         """
-        import time
-        
         try:
-            start = time.time()
-            
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getHealth",
-            }
-            
-            async with self.session.post(
-                endpoint.url,
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=2),
-            ) as resp:
-                await resp.json()
+            async with self._probe_slots:
+                # Zeit erst im Slot messen, Warten auf den Slot zählt nicht
+                start = time.perf_counter()
                 
-                latency_ms = (time.time() - start) * 1000
-                return latency_ms
+                async with self.session.post(
+                    endpoint.url,
+                    json=self.HEALTH_PAYLOAD,
+                    timeout=aiohttp.ClientTimeout(total=2),
+                ) as resp:
+                    latency_ms = (time.perf_counter() - start) * 1000
+                    # Body trotzdem lesen, sonst geht die Verbindung nicht zurück in den Pool
+                    body = await resp.read()
+                    
+                    if resp.status != 200:
+                        return float('inf')
+                    if deep and loads(body).get("result") != "ok":
+                        return float('inf')
+                    return latency_ms
         
         except Exception as e:
             log.debug("rpc_test_failed", url=endpoint.url, error=str(e))
@@ -182,11 +268,13 @@ class TransactionOptimizer:
         Returns:
             Transaction Signature oder None
         """
+        raw = bytes(transaction)  # einmal serialisieren, nicht pro Retry
+        
         for attempt in range(max_retries):
             try:
                 # Sende mit preflight skip für Geschwindigkeit
                 response = await client.send_raw_transaction(
-                    bytes(transaction),
+                    raw,
                     opts={
                         "skip_preflight": True,  # Schneller, weniger Checks
                         "preflight_commitment": "confirmed",
@@ -226,38 +314,103 @@ class TransactionOptimizer:
     ):
         """Warte auf Transaction Confirmation.
         
+        Push via signatureSubscribe (geteilter WS Hub), parallel der
+        gemeinsame Status-Poller - falls der WS nicht erreichbar ist oder
+        die TX schon vor dem Subscribe bestätigt wurde.
+        
         Args:
             client: RPC Client
             signature: Transaction Signature
             timeout: Max Wartezeit in Sekunden
         """
-        start = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        
+        polled = self._pending[signature] = loop.create_future()
+        if self._status_task is None or self._status_task.done():
+            self._status_task = asyncio.create_task(self._status_poller(client))
+        notification = asyncio.create_task(self._signature_notification(signature))
+        
+        try:
+            waiters = {polled, notification}
+            while waiters:
+                done, waiters = await asyncio.wait(
+                    waiters,
+                    timeout=max(deadline - loop.time(), 0),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+                
+                if polled in done:
+                    self._log_confirmation(signature, *polled.result())
+                    return
+                if notification.exception() is None:
+                    self._log_confirmation(signature, "confirmed", notification.result())
+                    return
+        finally:
+            notification.cancel()
+            if self._pending.get(signature) is polled:
+                del self._pending[signature]
+        
+        log.warning("transaction_confirmation_timeout", signature=signature)
+    
+    async def _status_poller(self, client: AsyncClient):
+        """Ein getSignatureStatuses Call für alle offenen Signaturen.
         
-        while (asyncio.get_event_loop().time() - start) < timeout:
+        Läuft solange Confirmations ausstehen und löst deren Futures mit
+        (status, err) auf.
+        """
+        while self._pending:
+            signatures = list(self._pending)[:self.MAX_STATUS_BATCH]
+            
             try:
-                response = await client.get_signature_statuses([signature])
+                # solders akzeptiert nur Signature Objekte, keine Strings
+                response = await client.get_signature_statuses(
+                    [Signature.from_string(s) for s in signatures]
+                )
                 
-                if response.value and response.value[0]:
-                    status = response.value[0]
-                    
-                    if status.confirmation_status in ["confirmed", "finalized"]:
-                        log.info(
-                            "transaction_confirmed",
-                            signature=signature,
-                            status=status.confirmation_status,
-                        )
-                        return
+                for signature, status in zip(signatures, response.value or ()):
+                    if status is None:
+                        continue
                     
                     if status.err:
-                        log.error("transaction_failed", signature=signature, error=status.err)
-                        raise Exception(f"Transaction failed: {status.err}")
+                        result = (None, status.err)
+                    elif status.confirmation_status in self.CONFIRMED_STATUSES:
+                        result = (str(status.confirmation_status), None)
+                    else:
+                        continue
+                    
+                    future = self._pending.pop(signature, None)
+                    if future is not None and not future.done():
+                        future.set_result(result)
             
             except Exception as e:
                 log.debug("confirmation_check_error", error=str(e))
             
-            await asyncio.sleep(1)
+            await asyncio.sleep(self.STATUS_POLL_INTERVAL_S)
+    
+    async def _signature_notification(self, signature: str):
+        """Erste signatureNotification abwarten.
         
-        log.warning("transaction_confirmation_timeout", signature=signature)
+        Returns:
+            ``err`` der Transaktion (None = erfolgreich)
+        """
+        stream = ws_hub.subscribe_signature(signature)
+        try:
+            frame = await anext(stream)
+        finally:
+            await stream.aclose()
+        
+        value = loads(frame).get('params', {}).get('result', {}).get('value') or {}
+        return value.get('err')
+    
+    @staticmethod
+    def _log_confirmation(signature: str, status: Optional[str], err):
+        if err:
+            log.error("transaction_failed", signature=signature, error=err)
+        else:
+            log.info("transaction_confirmed", signature=signature, status=status)
     
     async def send_via_jito(
         self,
@@ -275,39 +428,62 @@ class TransactionOptimizer:
         Returns:
             Bundle ID oder None
         """
-        if not self.session:
-            log.error("jito_send_failed", reason="No session")
-            return None
+        await self._ensure_session()
+        
+        # Jito Bundle Format - Body einmal encodiert, für alle Regionen
+        body = dumps({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "sendBundle",
+            "params": [
+                [bytes(transaction).hex()],  # Bundle mit einer TX
+            ],
+        })
         
-        # Wähle nächsten Jito Endpoint (Round Robin)
-        endpoint = self.JITO_ENDPOINTS[self.current_endpoint_idx % len(self.JITO_ENDPOINTS)]
-        self.current_endpoint_idx += 1
+        # An alle Regionen parallel - Bundles sind per Hash idempotent,
+        # die schnellste Region gewinnt
+        pending = {
+            asyncio.create_task(self._post_jito(endpoint, body))
+            for endpoint in self.JITO_ENDPOINTS
+        }
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        endpoint, bundle_id = result
+                        log.info("jito_bundle_sent", bundle_id=bundle_id, endpoint=endpoint, tip=tip_lamports)
+                        return bundle_id
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        return None
+    
+    async def _post_jito(self, endpoint: str, body: str) -> Optional[tuple]:
+        """Bundle an einen Block Engine senden.
         
+        Returns:
+            (endpoint, bundle_id) oder None - auch bei HTTP 200 mit JSON-RPC
+            ``error``, damit die anderen Regionen weiter laufen
+        """
         try:
             url = f"{endpoint}/api/v1/bundles"
             
-            # Jito Bundle Format
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "sendBundle",
-                "params": [
-                    [bytes(transaction).hex()],  # Bundle mit einer TX
-                ],
-            }
-            
-            async with self.session.post(url, json=payload, timeout=5) as resp:
+            async with self.session.post(url, data=body, headers=self.JSON_HEADERS, timeout=5) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = loads(await resp.read())
                     bundle_id = data.get("result")
-                    
-                    log.info("jito_bundle_sent", bundle_id=bundle_id, tip=tip_lamports)
-                    return bundle_id
+                    if bundle_id:
+                        return endpoint, bundle_id
+                    log.error("jito_send_rejected", endpoint=endpoint, error=data.get("error"))
                 else:
-                    log.error("jito_send_failed", status=resp.status)
+                    log.error("jito_send_failed", endpoint=endpoint, status=resp.status)
         
         except Exception as e:
-            log.error("jito_send_error", error=str(e))
+            log.error("jito_send_error", endpoint=endpoint, error=str(e))
         
         return None
 
@@ -315,34 +491,41 @@ class TransactionOptimizer:
 # Convenience functions
 async def optimize_transaction_speed():
     """Quick Setup: Optimiere RPC und Priority Fees."""
-    print("=" * 70)
-    print("⚡ Transaction Speed Optimizer")
-    print("=" * 70)
-    print()
-    
-    async with TransactionOptimizer() as optimizer:
-        print("🔍 Teste RPC Endpoints...")
-        fastest = await optimizer.get_fastest_rpc()
-        print(f"✅ Schnellster RPC: {fastest}")
-        print()
-        
-        print("⚙️  Empfohlene Settings:")
-        print(f"   Priority Fee: {optimizer.priority_fee_lamports} lamports (~$0.002)")
-        print(f"   Compute Units: {optimizer.compute_units}")
-        print(f"   Use Jito: {optimizer.use_jito}")
-        print()
-        
-        print("💡 In .env.production setzen:")
-        print(f"   SOLANA_RPC_URL={fastest}")
-        print(f"   PRIORITY_FEE_LAMPORTS={optimizer.priority_fee_lamports}")
-        print(f"   USE_JITO_BUNDLES=true")
-        print()
-        
-        print("📊 Speed Comparison:")
-        print("   Standard RPC:        2-5 Sekunden")
-        print("   Mit Priority Fee:    1-2 Sekunden")
-        print("   Mit Jito Bundle:     400-600ms ⚡")
+    try:
+        write_lines([
+            "=" * 70,
+            "⚡ Transaction Speed Optimizer",
+            "=" * 70,
+            "",
+            "🔍 Teste RPC Endpoints...",
+        ])
+        
+        async with TransactionOptimizer() as optimizer:
+            fastest = await optimizer.get_fastest_rpc()
+            
+            write_lines([
+                f"✅ Schnellster RPC: {fastest}",
+                "",
+                "⚙️  Empfohlene Settings:",
+                f"   Priority Fee: {optimizer.priority_fee_lamports} lamports (~$0.002)",
+                f"   Compute Units: {optimizer.compute_units}",
+                f"   Use Jito: {optimizer.use_jito}",
+                "",
+                "💡 In .env.production setzen:",
+                f"   SOLANA_RPC_URL={fastest}",
+                f"   PRIORITY_FEE_MICROLAMPORTS={optimizer.priority_fee_lamports}",
+                "   USE_JITO_BUNDLES=true",
+                f"   USE_UVLOOP=true  (aktuell: {loop_name()})",
+                "",
+                "📊 Speed Comparison:",
+                "   Standard RPC:        2-5 Sekunden",
+                "   Mit Priority Fee:    1-2 Sekunden",
+                "   Mit Jito Bundle:     400-600ms ⚡",
+            ])
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(optimize_transaction_speed())
+    from src.core.eventloop import run
+    run(optimize_transaction_speed())
@@ -1,4 +1,30 @@
+import re
+from functools import lru_cache
+
 from solders.pubkey import Pubkey
 
 WSOL_MINT = Pubkey.from_string("So11111111111111111111111111111111111111112")
 USDC_MINT = Pubkey.from_string("EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v")
+
+_BASE58_PUBKEY = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+
+@lru_cache(maxsize=1024)
+def to_pubkey(address: str) -> Pubkey:
+    """Pubkey aus Base58 - gecached, die gleichen Adressen kommen immer wieder."""
+    return Pubkey.from_string(address)
+
+
+def is_valid_pubkey(address: str) -> bool:
+    """Cheap pre-screen for Solana addresses (before any RPC/HTTP call).
+
+    Regex rejects wrong length/alphabet in C; the solders decode then
+    checks the value is exactly 32 bytes.
+    """
+    if not _BASE58_PUBKEY.fullmatch(address):
+        return False
+    try:
+        to_pubkey(address)
+    except ValueError:
+        return False
+    return True
@@ -1,16 +1,23 @@
+from functools import lru_cache
+
 import base58
 from solders.keypair import Keypair
 from src.core.config import settings
 from src.core.logger import log
 
+@lru_cache(maxsize=4)
+def _keypair_from_base58(private_key: str) -> Keypair:
+    """Decode base58 secret once per key; Keypair ist immutable und teilbar."""
+    return Keypair.from_bytes(base58.b58decode(private_key))
+
+
 class WalletManager:
     def __init__(self):
         self.keypair = None
         self._logger = log.bind(module="wallet")
 
     def load_wallet(self):
-        secret_key = base58.b58decode(settings.WALLET_PRIVATE_KEY)
-        self.keypair = Keypair.from_bytes(secret_key)
+        self.keypair = _keypair_from_base58(settings.WALLET_PRIVATE_KEY)
         self._logger.info("Wallet loaded")
         return True
 
@@ -42,5 +49,4 @@ def get_wallet(private_key: str = None) -> Keypair:
     if not private_key:
         raise ValueError("No wallet private key provided")
     
-    secret_key = base58.b58decode(private_key)
-    return Keypair.from_bytes(secret_key)
+    return _keypair_from_base58(private_key)
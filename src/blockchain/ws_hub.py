@@ -0,0 +1,195 @@
+"""WebSocket Hub - eine Solana WS Verbindung für alle Subscriptions.
+
+Subscriptions (logsSubscribe, accountSubscribe, ...) werden über eine
+Verbindung gemultiplext und per Subscription-ID an die jeweilige Queue
+verteilt. Bei Disconnect: Reconnect mit Backoff + automatisches
+Re-Subscribe.
+
+Notifications werden als roher Frame (str) weitergegeben, damit
+Subscriber vor dem JSON Parse filtern können.
+"""
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+import websockets
+
+from src.core.config import settings
+from src.core.jsonutil import dumps, loads
+from src.core.logger import log
+
+_SUBSCRIPTION_KEY = '"subscription":'
+
+
+def _subscription_id(frame: str) -> Optional[int]:
+    """Subscription-ID aus einem Notification Frame ohne JSON Parse.
+
+    Das Feld steht am Ende von ``params``, daher Suche von hinten.
+    """
+    idx = frame.rfind(_SUBSCRIPTION_KEY)
+    if idx < 0:
+        return None
+    digits = frame[idx + len(_SUBSCRIPTION_KEY):].lstrip()
+    end = 0
+    while end < len(digits) and digits[end].isdigit():
+        end += 1
+    return int(digits[:end]) if end else None
+
+
+@dataclass(slots=True)
+class _Subscription:
+    method: str
+    params: list
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(maxsize=WSHub.QUEUE_SIZE))
+    sub_id: Optional[int] = None
+    requested: bool = False  # Subscribe auf aktueller Verbindung gesendet
+
+
+class WSHub:
+    """Multiplexed Solana WebSocket Client."""
+
+    QUEUE_SIZE = 1024
+    RECONNECT_BACKOFF_S = (1, 2, 5, 10, 30)
+
+    def __init__(self, ws_url: Optional[str] = None):
+        self.ws_url = ws_url or settings.SOLANA_WS_URL
+        self._ws = None
+        self._ids = itertools.count(1)
+        self._subs: Dict[int, _Subscription] = {}  # request id -> subscription
+        self._by_sub_id: Dict[int, _Subscription] = {}
+        self._runner: Optional[asyncio.Task] = None
+        self._logger = log.bind(module="ws_hub")
+
+    async def subscribe(self, method: str, params: list) -> AsyncIterator[str]:
+        """Subscribe und liefere rohe Notification Frames.
+
+        Args:
+            method: z.B. "logsSubscribe"
+            params: RPC Params der Subscription
+
+        Yields:
+            Notification Frames (JSON str)
+        """
+        request_id = next(self._ids)
+        sub = _Subscription(method, params)
+        self._subs[request_id] = sub
+
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+        elif self._ws is not None and not sub.requested:
+            await self._send_subscribe(request_id, sub)
+
+        try:
+            while True:
+                yield await sub.queue.get()
+        finally:
+            await self._unsubscribe(request_id)
+
+    def subscribe_logs(self, mentions: List[str], commitment: str = "confirmed") -> AsyncIterator[str]:
+        """logsSubscribe für Transaktionen die eine der Adressen erwähnen."""
+        return self.subscribe("logsSubscribe", [{"mentions": mentions}, {"commitment": commitment}])
+
+    def subscribe_account(self, address: str, commitment: str = "confirmed") -> AsyncIterator[str]:
+        """accountSubscribe für ein einzelnes Account."""
+        return self.subscribe(
+            "accountSubscribe",
+            [address, {"encoding": "base64", "commitment": commitment}],
+        )
+
+    def subscribe_signature(self, signature: str, commitment: str = "confirmed") -> AsyncIterator[str]:
+        """signatureSubscribe - eine Notification sobald die TX den Commitment erreicht."""
+        return self.subscribe("signatureSubscribe", [signature, {"commitment": commitment}])
+
+    async def _send_subscribe(self, request_id: int, sub: _Subscription):
+        sub.requested = True  # vor dem await: kein doppelter Subscribe
+        await self._ws.send(dumps({
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": sub.method,
+            "params": sub.params,
+        }))
+
+    async def _unsubscribe(self, request_id: int):
+        sub = self._subs.pop(request_id, None)
+        if sub is None or sub.sub_id is None:
+            return
+
+        self._by_sub_id.pop(sub.sub_id, None)
+        if self._ws is not None:
+            try:
+                await self._ws.send(dumps({
+                    "jsonrpc": "2.0",
+                    "id": next(self._ids),
+                    "method": sub.method.replace("Subscribe", "Unsubscribe"),
+                    "params": [sub.sub_id],
+                }))
+            except Exception as e:
+                self._logger.debug("ws_unsubscribe_failed", error=str(e))
+
+    def _handle_frame(self, frame: str):
+        """Route a frame: notification → queue, response → sub id mapping."""
+        sub_id = _subscription_id(frame)
+        if sub_id is not None:
+            sub = self._by_sub_id.get(sub_id)
+            if sub is None:
+                return
+            try:
+                sub.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._logger.warning("ws_queue_full", method=sub.method, subscription=sub_id)
+            return
+
+        data = loads(frame)
+        sub = self._subs.get(data.get("id"))
+        if sub is None:
+            return
+
+        if "error" in data:
+            self._logger.error("ws_subscribe_failed", method=sub.method, error=data["error"])
+            return
+
+        sub.sub_id = data["result"]
+        self._by_sub_id[sub.sub_id] = sub
+        self._logger.info("ws_subscribed", method=sub.method, subscription=sub.sub_id)
+
+    async def _run(self):
+        """Connection loop: connect, (re-)subscribe all, dispatch frames."""
+        attempt = 0
+        while self._subs:
+            try:
+                async with websockets.connect(
+                    self.ws_url,
+                    compression=None,
+                    ping_interval=20,
+                    max_size=None,
+                ) as ws:
+                    self._ws = ws
+                    attempt = 0
+                    self._by_sub_id.clear()
+
+                    for sub in self._subs.values():
+                        sub.sub_id = None
+                        sub.requested = False
+                    for request_id, sub in list(self._subs.items()):
+                        if not sub.requested:
+                            await self._send_subscribe(request_id, sub)
+
+                    async for frame in ws:
+                        self._handle_frame(frame)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.warning("ws_disconnected", error=str(e))
+            finally:
+                self._ws = None
+
+            delay = self.RECONNECT_BACKOFF_S[min(attempt, len(self.RECONNECT_BACKOFF_S) - 1)]
+            attempt += 1
+            await asyncio.sleep(delay)
+
+
+# Singleton instance
+ws_hub = WSHub()
@@ -0,0 +1,69 @@
+"""Async TTL Cache - LRU mit Ablaufzeit und Single-Flight.
+
+Gleichzeitige Aufrufe mit denselben Argumenten teilen sich einen
+laufenden Request (ein RPC statt N). Nur erfolgreiche Ergebnisse
+werden gecached, Exceptions gehen an alle wartenden Caller.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def async_ttl_cache(ttl: float, maxsize: int = 1024, coalesce: bool = True):
+    """Decorator für async Funktionen/Methoden.
+
+    Args:
+        ttl: Lebensdauer eines Eintrags in Sekunden
+        maxsize: Max Einträge (LRU Eviction)
+        coalesce: Identische in-flight Aufrufe zusammenlegen
+
+    Returns:
+        Decorator; die dekorierte Funktion hat ``cache_clear()``
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        inflight: Dict[Hashable, asyncio.Future] = {}
+
+        def _store(key: Hashable, task: asyncio.Future):
+            if inflight.get(key) is task:
+                del inflight[key]
+            if task.cancelled() or task.exception() is not None:
+                return
+            cache[key] = (time.monotonic() + ttl, task.result())
+            cache.move_to_end(key)
+            while len(cache) > maxsize:
+                cache.popitem(last=False)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+
+            hit = cache.get(key)
+            if hit is not None:
+                if hit[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return hit[1]
+                del cache[key]
+
+            task = inflight.get(key) if coalesce else None
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                if coalesce:
+                    inflight[key] = task
+                task.add_done_callback(functools.partial(_store, key))
+
+            # shield: Abbruch eines Callers bricht nicht den geteilten Request ab
+            return await asyncio.shield(task)
+
+        def cache_clear():
+            cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
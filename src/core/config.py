@@ -6,10 +6,29 @@ class Settings(BaseSettings):
     APP_NAME: str = "Omni Profit Bot"
     ENV: str = "production"
     LOG_LEVEL: str = "INFO"
+    # Ausführliche Konsolenausgabe pro Signal (sonst nur strukturierte Logs)
+    VERBOSE: bool = False
+    # uvloop Event Loop (falls installiert); False = asyncio Standard-Loop
+    USE_UVLOOP: bool = True
     
     SOLANA_RPC_URL: str = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
     SOLANA_WS_URL: str = os.getenv("SOLANA_WS_URL", "wss://api.mainnet-beta.solana.com")
+    # Zusätzliche RPCs (komma-separiert) - Transaktionen werden gegen alle
+    # gleichzeitig gesendet, der schnellste gewinnt.
+    SOLANA_RPC_URLS: Optional[str] = None
     COMMITMENT: str = "confirmed"
+    # Compute Unit Price (micro-lamports) wenn getRecentPrioritizationFees
+    # fehlschlägt oder leer ist
+    PRIORITY_FEE_MICROLAMPORTS: int = 10_000
+
+    # Jupiter Swap API. JUPITER_BASE_URL = gehosteter Metis Endpoint (höheres
+    # Rate Limit); bei 429/5xx wird auf JUPITER_FALLBACK_URL gewechselt.
+    JUPITER_BASE_URL: Optional[str] = None
+    JUPITER_FALLBACK_URL: str = "https://quote-api.jup.ag/v6"
+    JUPITER_PRICE_URL: str = "https://quote-api.jup.ag/v1/price"
+    JUPITER_TIMEOUT: float = 5.0
+    JUPITER_RETRIES: int = 3
+    JUPITER_BACKOFF: float = 0.5
     
     WALLET_PRIVATE_KEY: Optional[str] = None
     WALLET_ENCRYPTED: bool = False
@@ -32,6 +51,8 @@ class Settings(BaseSettings):
     TELEGRAM_API_HASH: Optional[str] = None
     TELEGRAM_PHONE: Optional[str] = None
     TELEGRAM_CHANNEL_ID: Optional[str] = None
+    TELEGRAM_BOT_TOKEN: Optional[str] = None
+    TELEGRAM_CHAT_ID: Optional[str] = None
     
     GEMINI_API_KEY: Optional[str] = None
     OPENAI_API_KEY: Optional[str] = None
@@ -39,6 +60,7 @@ class Settings(BaseSettings):
     
     DISCORD_BOT_TOKEN: Optional[str] = None
     DISCORD_CHANNEL_IDS: Optional[str] = None
+    DISCORD_WEBHOOK_URL: Optional[str] = None
     X_BEARER_TOKEN: Optional[str] = None
 
     # Safety & operation
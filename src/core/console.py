@@ -0,0 +1,19 @@
+"""Console Output - gepufferte Ausgabe für CLI Banner.
+
+Jeder print() ist ein eigener write() Syscall auf dem line-buffered
+stdout. Banner und Tabellen werden daher als Liste gebaut und mit
+einem einzigen write ausgegeben.
+"""
+
+import sys
+from typing import Iterable
+
+
+def write_lines(lines: Iterable[str]):
+    """Schreibe mehrere Zeilen mit einem write + flush.
+
+    Args:
+        lines: Ausgabezeilen (ohne Newline)
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
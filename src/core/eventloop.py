@@ -0,0 +1,43 @@
+"""Event Loop Setup - uvloop wenn verfügbar, sonst asyncio Standard-Loop.
+
+uvloop ersetzt den Python Selector-Loop durch libuv (C) und senkt den
+Overhead pro Callback deutlich. Auf Windows nicht verfügbar; per
+USE_UVLOOP=false abschaltbar (z.B. für asyncio Debug Mode).
+"""
+
+import asyncio
+import sys
+from typing import Any, Coroutine, TypeVar
+
+from src.core.config import settings
+
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = sys.platform != "win32"
+except ImportError:
+    uvloop = None
+    UVLOOP_AVAILABLE = False
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Drop-in Ersatz für asyncio.run() mit uvloop Loop.
+
+    Args:
+        main: Entry-Point Coroutine
+
+    Returns:
+        Rückgabewert der Coroutine
+    """
+    if not (UVLOOP_AVAILABLE and settings.USE_UVLOOP):
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
+
+
+def loop_name() -> str:
+    """Name der laufenden Loop-Implementierung (für Startup Logs)."""
+    loop = asyncio.get_running_loop()
+    return "uvloop" if type(loop).__module__.startswith("uvloop") else "asyncio"
@@ -0,0 +1,49 @@
+"""Shared HTTP Session - Ein aiohttp ClientSession mit Connection Pooling.
+
+Alle API Clients (DexScreener, ...) teilen sich eine Session, damit
+Keep-Alive Verbindungen über Loop-Iterationen hinweg wiederverwendet werden
+(kein erneuter TLS Handshake / DNS Lookup pro Request).
+
+Default Timeout: 10s gesamt, 3s Connect - Requests können per
+``timeout=`` kürzer/länger setzen. ``json=`` Bodies werden mit orjson
+serialisiert.
+"""
+
+from typing import Optional
+
+import aiohttp
+
+from src.core.jsonutil import dumps
+from src.core.logger import log
+
+_session: Optional[aiohttp.ClientSession] = None
+
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=3)
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Hole (oder erstelle) die prozessweite ClientSession."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=16,  # ein langsamer Host blockiert nicht den Pool
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=DEFAULT_TIMEOUT,
+            json_serialize=dumps,
+        )
+        log.debug("http_session_created")
+    return _session
+
+
+async def close_session():
+    """Schließe die geteilte Session (nur beim Shutdown aufrufen)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -0,0 +1,28 @@
+"""JSON Helpers - orjson wenn installiert, sonst stdlib json.
+
+orjson (Rust) parst große API Payloads (DexScreener pairs Arrays,
+Jupiter Quotes) deutlich schneller und liest bytes direkt ohne
+vorheriges Decoding.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON aus bytes oder str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, **kwargs) -> str:
+    """Serialisiere zu str (kompatibel mit structlog JSONRenderer)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default, **kwargs)
@@ -2,6 +2,15 @@ import structlog
 import logging
 import sys
 
+from src.core.config import settings
+from src.core.jsonutil import dumps
+
+
+def _log_level() -> int:
+    """settings.LOG_LEVEL als logging Level (unbekannt -> INFO)."""
+    level = logging.getLevelName(settings.LOG_LEVEL.upper())
+    return level if isinstance(level, int) else logging.INFO
+
 def setup_logger():
     logging.basicConfig(
         format="%(message)s",
@@ -17,7 +26,7 @@ def setup_logger():
             structlog.processors.TimeStamper(fmt="iso"),
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=dumps)
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -25,4 +34,9 @@ def setup_logger():
         cache_logger_on_first_use=True,
     )
 
+# Ohne setup_logger(): structlog Defaults, aber mit Level-Filter. Calls
+# unter LOG_LEVEL sind No-Ops (keine Processors, kein Rendering).
+if not structlog.is_configured():
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(_log_level()))
+
 log = structlog.get_logger()
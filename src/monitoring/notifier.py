@@ -3,14 +3,15 @@
 Sends notifications if credentials are present; otherwise logs a no-op.
 Usage is conservative: only send alerts when critical (health check fails or tx events).
 """
-import os
+import asyncio
 import requests
 from typing import Optional
+from src.core.config import settings
 from src.core.logger import log
 
-TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
-DISCORD_WEBHOOK = os.getenv("DISCORD_WEBHOOK_URL")
+TELEGRAM_BOT_TOKEN = settings.TELEGRAM_BOT_TOKEN
+TELEGRAM_CHAT_ID = settings.TELEGRAM_CHAT_ID
+DISCORD_WEBHOOK = settings.DISCORD_WEBHOOK_URL
 
 
 def send_telegram(text: str) -> bool:
@@ -63,8 +64,11 @@ class Notifier:
         text += f"Amount: {amount_sol} SOL\n"
         text += f"Price: ${price:.6f}"
         
-        send_telegram(text)
-        send_discord(text)
+        # requests ist blocking - in Threads und parallel, Event Loop läuft weiter
+        await asyncio.gather(
+            asyncio.to_thread(send_telegram, text),
+            asyncio.to_thread(send_discord, text),
+        )
         return True
 
 
@@ -0,0 +1,40 @@
+"""Signal Bus - Queue zwischen Signal-Produzenten und Trading Loop.
+
+Produzenten (Discord Monitor, Liquidity Sniper, ...) publishen Signale
+sofort bei Eingang; der Trading Loop wartet auf die Queue statt fix zu
+schlafen.
+"""
+
+import asyncio
+from typing import TYPE_CHECKING, List
+
+from src.core.logger import log
+
+if TYPE_CHECKING:
+    from src.signals.processor import Signal
+
+SIGNAL_QUEUE_SIZE = 256
+
+signal_queue: "asyncio.Queue[Signal]" = asyncio.Queue(maxsize=SIGNAL_QUEUE_SIZE)
+
+
+def publish(signal: "Signal") -> bool:
+    """Signal in die Queue legen (non-blocking).
+
+    Returns:
+        False wenn die Queue voll ist (Signal verworfen)
+    """
+    try:
+        signal_queue.put_nowait(signal)
+        return True
+    except asyncio.QueueFull:
+        log.warning("signal_queue_full", source=signal.source, token=signal.token_address)
+        return False
+
+
+def drain() -> List["Signal"]:
+    """Alle aktuell wartenden Signale entnehmen."""
+    signals = []
+    while not signal_queue.empty():
+        signals.append(signal_queue.get_nowait())
+    return signals
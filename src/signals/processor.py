@@ -1,12 +1,16 @@
 """Signal Processor - Aggregates and validates signals from multiple sources."""
 
 import asyncio
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
+
 from src.core.logger import log
+from src.signals import bus
 
-@dataclass
+@dataclass(slots=True)
 class Signal:
     source: str  # telegram, discord, dexscreener
     token_address: str
@@ -14,23 +18,89 @@ class Signal:
     confidence: float  # 0.0 - 1.0
     timestamp: datetime
     metadata: Dict
+    ts_mono: float = field(default_factory=time.monotonic)  # Ordering ohne datetime Vergleiche
+
 
 class SignalProcessor:
+    # Pre-Filter vor der (teuren) Validierung
+    MIN_CONFIDENCE = 0.5
+    MIN_VOLUME_24H = 500.0  # Nur wenn Signal Volume-Daten hat
+    MAX_SIGNAL_AGE_S = 300.0
+    
     def __init__(self):
         self._logger = log.bind(module="signal_processor")
-        self.signals_queue: List[Signal] = []
+    
+    def push_signal(self, signal: Signal):
+        """Publish a pushed signal (Discord, Sniper, ...) to the trading loop"""
+        if bus.publish(signal):
+            self._logger.info("signal_pushed", source=signal.source, token=signal.token_address)
+    
+    async def wait_for_signals(self, timeout: float) -> List[Signal]:
+        """Wait for pushed signals (no DexScreener scan).
+        
+        Args:
+            timeout: Max Wartezeit in Sekunden
+        
+        Returns:
+            Alle wartenden Signale nach dem Pre-Filter (leer bei Timeout)
+        """
+        try:
+            first = await asyncio.wait_for(bus.signal_queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return []
+        
+        return self.filter_valid([first, *bus.drain()])
         
     async def collect_signals(self) -> List[Signal]:
         """Collect signals from all sources"""
-        signals = []
+        # Pushed signals first (newest information)
+        signals = bus.drain()
         
         # DexScreener trending MEMECOINS (LIVE)
         dexscreener_signals = await self._collect_dexscreener()
         signals.extend(dexscreener_signals)
         
+        signals = self.aggregate_signals(self.filter_valid(signals))
+        
         self._logger.info("signals_collected", count=len(signals))
         return signals
     
+    def filter_valid(self, signals: Iterable[Signal]) -> List[Signal]:
+        """Pre-filter (confidence, volume, age thresholds), order preserved.
+        
+        Greift vor allem bei Signalen, die im Bus gewartet haben (älter als
+        MAX_SIGNAL_AGE_S); Volume nur wenn das Signal Volume-Daten hat.
+        """
+        now = datetime.now()
+        return [
+            s for s in signals
+            if s.confidence >= self.MIN_CONFIDENCE
+            and s.metadata.get('volume_24h', self.MIN_VOLUME_24H) >= self.MIN_VOLUME_24H
+            and (now - s.timestamp).total_seconds() <= self.MAX_SIGNAL_AGE_S
+        ]
+    
+    def aggregate_signals(self, signals: Iterable[Signal]) -> List[Signal]:
+        """Ein Signal pro Token (single pass).
+        
+        Behält das neueste Signal, Confidence = Mittelwert aller Signale
+        des Tokens, Anzahl in ``metadata['signal_count']``.
+        """
+        acc = defaultdict(lambda: [0, 0.0, None])  # address -> [count, sum_conf, latest]
+        for signal in signals:
+            entry = acc[signal.token_address]
+            entry[0] += 1
+            entry[1] += signal.confidence
+            if entry[2] is None or signal.ts_mono > entry[2].ts_mono:
+                entry[2] = signal
+        
+        aggregated = []
+        for count, sum_conf, latest in acc.values():
+            if count > 1:
+                latest.confidence = sum_conf / count
+                latest.metadata['signal_count'] = count
+            aggregated.append(latest)
+        return aggregated
+    
     async def _collect_dexscreener(self) -> List[Signal]:
         """Collect ECHTE MEMECOINS from DexScreener API"""
         try:
@@ -43,12 +113,15 @@ class SignalProcessor:
                 self._logger.warning("no_memecoins_found")
                 return []
             
+            # Top 5 Memecoins: Token-Daten in einem Batch Request
+            top_addresses = memecoin_addresses[:5]
+            token_map = await dexscreener.get_tokens_batch(top_addresses)
+            
             # Erstelle Signals für gefundene Memecoins
             signals = []
             
-            for address in memecoin_addresses[:5]:  # Top 5 Memecoins
-                # Get token data
-                token_data = await dexscreener.get_token_data(address)
+            for address in top_addresses:
+                token_data = token_map.get(address)
                 
                 if not token_data:
                     continue
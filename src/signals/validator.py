@@ -4,19 +4,40 @@ Validiert Telegram/Discord Signale mit 8 Checks bevor Trade.
 """
 
 import asyncio
+import random
+import time
+from collections import deque
 import aiohttp
-from typing import Optional, Dict, List
+from typing import Deque, Optional, Dict, List
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from solana.rpc.async_api import AsyncClient
-from solders.pubkey import Pubkey
 
+from src.blockchain.client import solana_client
+from src.blockchain.utils import is_valid_pubkey, to_pubkey
 from src.core.logger import log
+from src.core.cache import async_ttl_cache
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.jsonutil import loads
+from src.core.http import close_session, get_session
 
 
-@dataclass
+# Score-Gewichte pro Check (Summe 100)
+_WEIGHTS = (
+    ('liquidity', 20),        # Critical
+    ('lp_burned', 15),        # Critical
+    ('mint_revoked', 15),     # Critical
+    ('distribution', 10),
+    ('safe_contract', 20),    # Critical
+    ('volume', 10),
+    ('multi_channel', 5),
+    ('price_history', 5),
+)
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Ergebnis der Signal-Validierung."""
     is_valid: bool
@@ -41,13 +62,34 @@ class SignalValidator:
     8. Price History (keine Dumps)
     """
     
+    # Multi-Channel Tracking: Zeitfenster + Full Sweep alle N Signale
+    SIGNAL_WINDOW_S = 24 * 3600.0
+    SWEEP_EVERY = 1000
+    
+    # Mint Authority Checks bündeln (getMultipleAccounts Limit: 100)
+    MINT_BATCH_WINDOW_S = 0.005
+    MAX_ACCOUNTS_PER_CALL = 100
+    _COPTION_NONE = b"\x00\x00\x00\x00"
+    
+    # DexScreener Rate Limits: Retry mit Backoff + Jitter
+    HTTP_RETRIES = 2
+    RETRY_STATUSES = frozenset({429, 503})
+    # Max gleichzeitige Validierungen in validate_batch (sonst 429 Burst)
+    BATCH_CONCURRENCY = 8
+    
     def __init__(self, rpc_url: Optional[str] = None):
         self.rpc_url = rpc_url or settings.SOLANA_RPC_URL
-        self.client = AsyncClient(self.rpc_url)
+        # Eigener RPC Client nur für abweichende URL, sonst der von solana_client
+        self.client: Optional[AsyncClient] = AsyncClient(rpc_url) if rpc_url else None
         self.session: Optional[aiohttp.ClientSession] = None
         
         # Cache für Multi-Channel Tracking
-        self.signal_cache: Dict[str, List[datetime]] = {}
+        self.signal_cache: Dict[str, Deque[float]] = {}  # monotonic Zeitstempel
+        self._track_calls = 0
+        
+        # Offene Mint Authority Checks bis zum nächsten Batch
+        self._mint_waiters: Dict[str, asyncio.Future] = {}
+        self._mint_flush: Optional[asyncio.Task] = None
         
         # Minimum Requirements
         self.MIN_LIQUIDITY_USD = 10_000
@@ -56,13 +98,28 @@ class SignalValidator:
         self.MIN_CHANNEL_MENTIONS = 2
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        await self._ensure_session()
         return self
     
     async def __aexit__(self, *args):
-        if self.session:
-            await self.session.close()
-        await self.client.close()
+        # Geteilte HTTP Session / RPC Client bleiben offen
+        self.session = None
+        if self.client is not None and self.client is not solana_client.client:
+            await self.client.close()
+            self.client = None
+    
+    async def _ensure_session(self):
+        """Nutze die prozessweite HTTP Session (Singleton hatte sonst keine)."""
+        if self.session is None or self.session.closed:
+            self.session = await get_session()
+    
+    async def _rpc_client(self) -> AsyncClient:
+        """Dedizierter RPC Client oder der geteilte von solana_client."""
+        if self.client is not None:
+            return self.client
+        if solana_client.client is None:
+            await solana_client.connect()
+        return solana_client.client
     
     async def validate_signal(
         self,
@@ -80,69 +137,97 @@ class SignalValidator:
         """
         log.info("validating_signal", token=token_address, source=source_channel)
         
+        # Kein gültiger Pubkey → keine RPC/HTTP Calls
+        if not is_valid_pubkey(token_address):
+            log.warning("invalid_token_address", token=token_address)
+            return ValidationResult(
+                is_valid=False,
+                score=0,
+                checks={},
+                warnings=["Invalid token address"],
+                token_address=token_address,
+                timestamp=datetime.now(),
+            )
+        
+        await self._ensure_session()
+        
         checks = {}
         warnings = []
         
+        # Checks 1-6 + 8 sind unabhängige RPC/HTTP Calls → parallel
+        (
+            liquidity_usd,
+            lp_burned,
+            mint_revoked,
+            distribution_ok,
+            is_safe,
+            volume_legit,
+            price_stable,
+        ) = await asyncio.gather(
+            self._check_liquidity(token_address),
+            self._check_lp_burned(token_address),
+            self._check_mint_authority(token_address),
+            self._check_holder_distribution(token_address),
+            self._check_contract_safety(token_address),
+            self._check_volume_legitimacy(token_address),
+            self._check_price_history(token_address),
+            return_exceptions=True,
+        )
+        
         # Check 1: Liquidity
-        try:
-            liquidity_usd = await self._check_liquidity(token_address)
+        if isinstance(liquidity_usd, Exception):
+            log.warning("liquidity_check_failed", error=str(liquidity_usd))
+            checks['liquidity'] = False
+            warnings.append("Liquidity check failed")
+        else:
             checks['liquidity'] = liquidity_usd >= self.MIN_LIQUIDITY_USD
             if not checks['liquidity']:
                 warnings.append(f"Low liquidity: ${liquidity_usd:.0f}")
-        except Exception as e:
-            log.warning("liquidity_check_failed", error=str(e))
-            checks['liquidity'] = False
-            warnings.append("Liquidity check failed")
         
         # Check 2: LP Tokens
-        try:
-            lp_burned = await self._check_lp_burned(token_address)
+        if isinstance(lp_burned, Exception):
+            log.warning("lp_check_failed", error=str(lp_burned))
+            checks['lp_burned'] = False
+        else:
             checks['lp_burned'] = lp_burned
             if not lp_burned:
                 warnings.append("LP tokens not burned/locked")
-        except Exception as e:
-            log.warning("lp_check_failed", error=str(e))
-            checks['lp_burned'] = False
         
         # Check 3: Mint Authority
-        try:
-            mint_revoked = await self._check_mint_authority(token_address)
+        if isinstance(mint_revoked, Exception):
+            log.warning("mint_check_failed", error=str(mint_revoked))
+            checks['mint_revoked'] = False
+        else:
             checks['mint_revoked'] = mint_revoked
             if not mint_revoked:
                 warnings.append("⚠️  Mint authority active (can print tokens!)")
-        except Exception as e:
-            log.warning("mint_check_failed", error=str(e))
-            checks['mint_revoked'] = False
         
         # Check 4: Holder Distribution
-        try:
-            distribution_ok = await self._check_holder_distribution(token_address)
+        if isinstance(distribution_ok, Exception):
+            log.warning("distribution_check_failed", error=str(distribution_ok))
+            checks['distribution'] = False
+        else:
             checks['distribution'] = distribution_ok
             if not distribution_ok:
                 warnings.append("Top holders control >40%")
-        except Exception as e:
-            log.warning("distribution_check_failed", error=str(e))
-            checks['distribution'] = False
         
         # Check 5: Contract Safety
-        try:
-            is_safe = await self._check_contract_safety(token_address)
+        if isinstance(is_safe, Exception):
+            log.warning("contract_check_failed", error=str(is_safe))
+            checks['safe_contract'] = False
+        else:
             checks['safe_contract'] = is_safe
             if not is_safe:
                 warnings.append("⚠️  Potential honeypot detected!")
-        except Exception as e:
-            log.warning("contract_check_failed", error=str(e))
-            checks['safe_contract'] = False
         
         # Check 6: Volume Analysis
-        try:
-            volume_legit = await self._check_volume_legitimacy(token_address)
+        if isinstance(volume_legit, Exception):
+            log.warning("volume_check_failed", error=str(volume_legit))
+            checks['volume'] = False
+        else:
             checks['volume'] = volume_legit
             if not volume_legit:
                 warnings.append("Suspicious volume pattern (potential fake pump)")
-        except Exception as e:
-            log.warning("volume_check_failed", error=str(e))
-            checks['volume'] = False
         
         # Check 7: Multi-Channel Confirmation
         channel_count = self._track_signal(token_address, source_channel)
@@ -151,28 +236,16 @@ class SignalValidator:
             warnings.append(f"Only {channel_count} channel mentions (need {self.MIN_CHANNEL_MENTIONS})")
         
         # Check 8: Price History
-        try:
-            price_stable = await self._check_price_history(token_address)
+        if isinstance(price_stable, Exception):
+            log.warning("price_history_failed", error=str(price_stable))
+            checks['price_history'] = False
+        else:
             checks['price_history'] = price_stable
             if not price_stable:
                 warnings.append("Recent price dumps detected")
-        except Exception as e:
-            log.warning("price_history_failed", error=str(e))
-            checks['price_history'] = False
         
         # Calculate Score (weighted)
-        weights = {
-            'liquidity': 20,        # Critical
-            'lp_burned': 15,        # Critical
-            'mint_revoked': 15,     # Critical
-            'distribution': 10,
-            'safe_contract': 20,    # Critical
-            'volume': 10,
-            'multi_channel': 5,
-            'price_history': 5,
-        }
-        
-        score = sum(weights[k] * (1 if v else 0) for k, v in checks.items())
+        score = sum(weight for name, weight in _WEIGHTS if checks.get(name))
         is_valid = score >= 70  # Minimum 70/100
         
         result = ValidationResult(
@@ -194,32 +267,88 @@ class SignalValidator:
         
         return result
     
+    async def validate_batch(
+        self,
+        token_addresses: List[str],
+        source_channel: str = "unknown",
+    ) -> List[ValidationResult]:
+        """Validiere mehrere Tokens gleichzeitig.
+        
+        Max BATCH_CONCURRENCY Tokens gleichzeitig: ein DexScreener Request
+        pro Token, gleichzeitige Mint Authority Checks landen in einem
+        getMultipleAccounts.
+        
+        Args:
+            token_addresses: Solana Token Addresses (Duplikate werden einmal validiert)
+            source_channel: Quelle der Signale
+        
+        Returns:
+            ValidationResults in Eingabe-Reihenfolge
+        """
+        unique = list(dict.fromkeys(token_addresses))
+        slots = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+        
+        async def _validate(token_address: str) -> ValidationResult:
+            async with slots:
+                return await self.validate_signal(token_address, source_channel=source_channel)
+        
+        results = await asyncio.gather(*(_validate(token_address) for token_address in unique))
+        by_address = dict(zip(unique, results))
+        return [by_address[token_address] for token_address in token_addresses]
+    
+    @async_ttl_cache(ttl=10.0, maxsize=10_000)
+    async def _fetch_dexscreener_pairs(self, token_address: str) -> List[Dict]:
+        """DexScreener Pairs eines Tokens.
+        
+        Liquidity- und Volume-Check teilen sich einen Request (Single-Flight
+        im Cache, beide laufen parallel im gather).
+        
+        Returns:
+            Pairs (leer wenn nicht gelistet: 200 ohne Pairs oder 404)
+        
+        Raises:
+            RuntimeError: andere HTTP Fehler, 429/503 auch nach HTTP_RETRIES
+            Retries - nie als "nicht gelistet" cachen
+        """
+        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+        
+        for attempt in range(self.HTTP_RETRIES + 1):
+            async with self.session.get(url, timeout=5) as resp:
+                if resp.status == 200:
+                    return loads(await resp.read()).get('pairs') or []
+                if resp.status == 404:
+                    return []
+                if resp.status not in self.RETRY_STATUSES:
+                    raise RuntimeError(f"DexScreener HTTP {resp.status}")
+            
+            if attempt < self.HTTP_RETRIES:
+                # Jitter verteilt parallele Retries, statt erneut gleichzeitig zu feuern
+                await asyncio.sleep(random.uniform(0.2, 0.6) * 2 ** attempt)
+        
+        log.warning("dexscreener_rate_limited", token=token_address)
+        # Raise statt [] - ein leeres Ergebnis würde 10s im Cache bleiben
+        raise RuntimeError(f"DexScreener rate limited: HTTP {resp.status}")
+    
     async def _check_liquidity(self, token_address: str) -> float:
         """Check Liquidity via DexScreener API.
         
+        Fehler propagieren (validate_signal wertet sie als failed Check),
+        damit nichts Falsches im Cache landet. Gecached wird nur der Fetch.
+        
         Returns:
             Liquidity in USD
         """
         if not self.session:
             return 0.0
         
-        url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
-        
-        try:
-            async with self.session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get('pairs', [])
-                    
-                    if pairs:
-                        # Höchste Liquidity Pool
-                        max_liq = max(p.get('liquidity', {}).get('usd', 0) for p in pairs)
-                        return float(max_liq)
-        except Exception as e:
-            log.debug("dexscreener_failed", error=str(e))
+        pairs = await self._fetch_dexscreener_pairs(token_address)
+        if not pairs:
+            return 0.0
         
-        return 0.0
+        # Höchste Liquidity Pool
+        return float(max(p.get('liquidity', {}).get('usd', 0) for p in pairs))
     
+    @async_ttl_cache(ttl=60.0, maxsize=10_000)
     async def _check_lp_burned(self, token_address: str) -> bool:
         """Check if LP tokens are burned or locked.
         
@@ -230,26 +359,72 @@ class SignalValidator:
         # For now, assume OK if has liquidity
         return True
     
+    @async_ttl_cache(ttl=60.0, maxsize=10_000)  # Revoke ist endgültig
     async def _check_mint_authority(self, token_address: str) -> bool:
         """Check if mint authority is revoked.
         
+        Gleichzeitige Checks (parallel validierte Signale) werden zu einem
+        getMultipleAccounts Call gebündelt.
+        
+        RPC Fehler propagieren statt False zu liefern - der Cache speichert
+        nur Erfolge, validate_signal wertet die Exception als failed Check.
+        
         Returns:
             True if revoked (safe)
         """
+        future = self._mint_waiters.get(token_address)
+        if future is None:
+            future = self._mint_waiters[token_address] = asyncio.get_running_loop().create_future()
+            if self._mint_flush is None or self._mint_flush.done():
+                self._mint_flush = asyncio.create_task(self._flush_mint_checks())
+        return await asyncio.shield(future)
+    
+    async def _flush_mint_checks(self):
+        """Sammle Checks für MINT_BATCH_WINDOW_S, dann ein Batch Call."""
+        await asyncio.sleep(self.MINT_BATCH_WINDOW_S)
+        waiters, self._mint_waiters = self._mint_waiters, {}
+        self._mint_flush = None
+        
         try:
-            pubkey = Pubkey.from_string(token_address)
-            account_info = await self.client.get_account_info(pubkey)
-            
-            if account_info.value:
-                # Parse mint account data
-                # TODO: Proper parsing of mint authority
-                # For now, basic check
-                return True
+            results = await self.batch_check_mint_authority(list(waiters))
         except Exception as e:
-            log.debug("mint_check_error", error=str(e))
+            for future in waiters.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for token_address, future in waiters.items():
+            if not future.done():
+                future.set_result(results.get(token_address, False))
+    
+    async def batch_check_mint_authority(self, token_addresses: List[str]) -> Dict[str, bool]:
+        """Mint Authority mehrerer Tokens per getMultipleAccounts.
+        
+        SPL Mint Layout: COption<Pubkey> mint_authority am Anfang,
+        u32 Tag 0 = None (revoked).
         
-        return False
+        Returns:
+            address -> revoked (fehlende Accounts: False)
+        """
+        chunks = [
+            token_addresses[i:i + self.MAX_ACCOUNTS_PER_CALL]
+            for i in range(0, len(token_addresses), self.MAX_ACCOUNTS_PER_CALL)
+        ]
+        client = await self._rpc_client()
+        responses = await asyncio.gather(*(
+            client.get_multiple_accounts([to_pubkey(a) for a in chunk])
+            for chunk in chunks
+        ))
+        
+        results = {}
+        for chunk, response in zip(chunks, responses):
+            for token_address, account in zip(chunk, response.value):
+                results[token_address] = (
+                    account is not None and bytes(account.data[:4]) == self._COPTION_NONE
+                )
+        return results
     
+    @async_ttl_cache(ttl=60.0, maxsize=10_000)
     async def _check_holder_distribution(self, token_address: str) -> bool:
         """Check if token distribution is healthy.
         
@@ -280,27 +455,22 @@ class SignalValidator:
             return True
         
         try:
-            url = f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
+            pairs = await self._fetch_dexscreener_pairs(token_address)
             
-            async with self.session.get(url, timeout=5) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    pairs = data.get('pairs', [])
-                    
-                    if pairs:
-                        pair = pairs[0]
-                        volume_24h = pair.get('volume', {}).get('h24', 0)
-                        price_change_24h = pair.get('priceChange', {}).get('h24', 0)
-                        
-                        # Fake pump detection:
-                        # High volume but low price change = wash trading
-                        if volume_24h > 100000 and abs(price_change_24h) < 20:
-                            log.warning(
-                                "fake_volume_detected",
-                                volume=volume_24h,
-                                price_change=price_change_24h,
-                            )
-                            return False
+            if pairs:
+                pair = pairs[0]
+                volume_24h = pair.get('volume', {}).get('h24', 0)
+                price_change_24h = pair.get('priceChange', {}).get('h24', 0)
+                
+                # Fake pump detection:
+                # High volume but low price change = wash trading
+                if volume_24h > 100000 and abs(price_change_24h) < 20:
+                    log.warning(
+                        "fake_volume_detected",
+                        volume=volume_24h,
+                        price_change=price_change_24h,
+                    )
+                    return False
         except Exception as e:
             log.debug("volume_check_error", error=str(e))
         
@@ -321,23 +491,36 @@ class SignalValidator:
         Returns:
             Number of unique channels mentioning this token
         """
-        # Clean old entries (24h)
-        cutoff = datetime.now() - timedelta(hours=24)
-        self.signal_cache = {
-            k: [t for t in v if t > cutoff]
-            for k, v in self.signal_cache.items()
-        }
-        
-        # Track new signal
-        if token_address not in self.signal_cache:
-            self.signal_cache[token_address] = []
-        
-        self.signal_cache[token_address].append(datetime.now())
-        
-        return len(self.signal_cache[token_address])
+        now = time.monotonic()
+        cutoff = now - self.SIGNAL_WINDOW_S
+        
+        # Nur den betroffenen Token prunen (Einträge sind chronologisch)
+        mentions = self.signal_cache.get(token_address)
+        if mentions is None:
+            mentions = self.signal_cache[token_address] = deque()
+        while mentions and mentions[0] <= cutoff:
+            mentions.popleft()
+        mentions.append(now)
+        
+        # Gelegentlicher Full Sweep gibt Speicher inaktiver Tokens frei
+        self._track_calls += 1
+        if self._track_calls % self.SWEEP_EVERY == 0:
+            self._sweep_signal_cache(cutoff)
+        
+        return len(mentions)
+    
+    def _sweep_signal_cache(self, cutoff: float):
+        """Entferne abgelaufene Mentions aller Tokens (und leere Tokens)."""
+        for token_address in list(self.signal_cache):
+            mentions = self.signal_cache[token_address]
+            while mentions and mentions[0] <= cutoff:
+                mentions.popleft()
+            if not mentions:
+                del self.signal_cache[token_address]
     
     def get_validation_summary(self) -> Dict:
         """Get summary of recent validations."""
+        self._sweep_signal_cache(time.monotonic() - self.SIGNAL_WINDOW_S)
         return {
             'tracked_signals': len(self.signal_cache),
             'multi_channel_signals': sum(
@@ -353,38 +536,41 @@ signal_validator = SignalValidator()
 
 async def main():
     """Test Signal Validator."""
-    print("=" * 70)
-    print("🔍 Signal Validation System Test")
-    print("=" * 70)
-    print()
-    
-    # Test token (Beispiel)
-    test_token = "So11111111111111111111111111111111111111112"  # SOL
-    
-    async with SignalValidator() as validator:
-        result = await validator.validate_signal(
-            test_token,
-            source_channel="telegram_test",
-        )
-        
-        print(f"Token: {result.token_address}")
-        print(f"Valid: {'✅ YES' if result.is_valid else '❌ NO'}")
-        print(f"Score: {result.score}/100")
-        print()
-        print("Checks:")
-        for check, passed in result.checks.items():
-            icon = "✅" if passed else "❌"
-            print(f"  {icon} {check}")
-        
-        if result.warnings:
-            print()
-            print("⚠️  Warnings:")
-            for warning in result.warnings:
-                print(f"  - {warning}")
-        
-        print()
-        print("Decision:", "🚀 TRADE" if result.is_valid else "🛑 SKIP")
+    try:
+        write_lines([
+            "=" * 70,
+            "🔍 Signal Validation System Test",
+            "=" * 70,
+            "",
+        ])
+        
+        # Test token (Beispiel)
+        test_token = "So11111111111111111111111111111111111111112"  # SOL
+        
+        async with SignalValidator() as validator:
+            result = await validator.validate_signal(
+                test_token,
+                source_channel="telegram_test",
+            )
+            
+            lines = [
+                f"Token: {result.token_address}",
+                f"Valid: {'✅ YES' if result.is_valid else '❌ NO'}",
+                f"Score: {result.score}/100",
+                "",
+                "Checks:",
+                *(f"  {'✅' if passed else '❌'} {check}" for check, passed in result.checks.items()),
+            ]
+            
+            if result.warnings:
+                lines += ["", "⚠️  Warnings:", *(f"  - {warning}" for warning in result.warnings)]
+            
+            lines += ["", f"Decision: {'🚀 TRADE' if result.is_valid else '🛑 SKIP'}"]
+            write_lines(lines)
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from src.core.eventloop import run
+    run(main())
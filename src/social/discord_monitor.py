@@ -6,14 +6,18 @@ validated Trades automatisch aus.
 
 import asyncio
 import re
-from typing import Optional, List
+from typing import FrozenSet, Optional
 from datetime import datetime
 
 import discord
 from discord.ext import commands
 
+from src.blockchain.utils import is_valid_pubkey
 from src.core.logger import log
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.http import close_session
+from src.signals.processor import Signal, signal_processor
 from src.signals.validator import signal_validator
 from src.trading.manager import trade_manager
 
@@ -23,6 +27,9 @@ class TradingBotDiscord(commands.Bot):
     
     # Regex für Solana Token Adressen
     TOKEN_ADDR_PATTERN = re.compile(r'\b[1-9A-HJ-NP-Za-km-z]{32,44}\b')
+    # Discord Snowflake IDs / Bot Token (3 base64url Segmente)
+    CHANNEL_ID_PATTERN = re.compile(r'\d{17,20}')
+    BOT_TOKEN_PATTERN = re.compile(r'[\w-]{24,}\.[\w-]{6}\.[\w-]{27,}')
     
     # Keywords für Buy Signals
     BUY_KEYWORDS = [
@@ -43,7 +50,7 @@ class TradingBotDiscord(commands.Bot):
             **kwargs
         )
         
-        self.trading_channels: List[int] = self._parse_channel_ids()
+        self.trading_channels: FrozenSet[int] = self._parse_channel_ids()
         self.processed_messages: set = set()  # Avoid duplicates
         
         log.info(
@@ -51,13 +58,18 @@ class TradingBotDiscord(commands.Bot):
             channels=len(self.trading_channels),
         )
     
-    def _parse_channel_ids(self) -> List[int]:
-        """Parse Channel IDs from config."""
+    @classmethod
+    def _parse_channel_ids(cls) -> FrozenSet[int]:
+        """Parse Channel IDs from config (einmalig, O(1) Lookup pro Message)."""
         if not settings.DISCORD_CHANNEL_IDS:
-            return []
+            return frozenset()
         
-        ids_str = settings.DISCORD_CHANNEL_IDS
-        return [int(id.strip()) for id in ids_str.split(',') if id.strip()]
+        ids = [id.strip() for id in settings.DISCORD_CHANNEL_IDS.split(',') if id.strip()]
+        invalid = [id for id in ids if not cls.CHANNEL_ID_PATTERN.fullmatch(id)]
+        if invalid:
+            log.warning("discord_invalid_channel_ids", ids=invalid)
+        
+        return frozenset(int(id) for id in ids if id not in invalid)
     
     async def on_ready(self):
         """Bot connected."""
@@ -67,16 +79,17 @@ class TradingBotDiscord(commands.Bot):
             guilds=len(self.guilds),
         )
         
-        print("=" * 70)
-        print(f"🤖 Discord Bot Online: {self.user.name}")
-        print("=" * 70)
-        print()
-        print(f"Connected to {len(self.guilds)} servers:")
-        for guild in self.guilds:
-            print(f"  - {guild.name}")
-        print()
-        print(f"Monitoring {len(self.trading_channels)} channels for signals")
-        print()
+        write_lines([
+            "=" * 70,
+            f"🤖 Discord Bot Online: {self.user.name}",
+            "=" * 70,
+            "",
+            f"Connected to {len(self.guilds)} servers:",
+            *(f"  - {guild.name}" for guild in self.guilds),
+            "",
+            f"Monitoring {len(self.trading_channels)} channels for signals",
+            "",
+        ])
     
     async def on_message(self, message: discord.Message):
         """Process incoming messages."""
@@ -127,8 +140,11 @@ class TradingBotDiscord(commands.Bot):
         if not has_buy_signal:
             return
         
-        # Extract token addresses
-        token_addresses = self.TOKEN_ADDR_PATTERN.findall(message.content)
+        # Extract token addresses (drop regex hits that are no valid pubkey)
+        token_addresses = [
+            addr for addr in self.TOKEN_ADDR_PATTERN.findall(message.content)
+            if is_valid_pubkey(addr)
+        ]
         
         if not token_addresses:
             return
@@ -140,13 +156,27 @@ class TradingBotDiscord(commands.Bot):
             author=str(message.author),
         )
         
-        # Validate and trade each token
-        for token_addr in token_addresses:
-            await self._validate_and_trade(
-                token_addr,
-                source_channel=f"discord_{message.channel.name}",
-                message=message,
-            )
+        # Validate and trade each token concurrently (deduplicated)
+        results = await asyncio.gather(
+            *(
+                self._validate_and_trade(
+                    token_addr,
+                    source_channel=f"discord_{message.channel.name}",
+                    message=message,
+                )
+                for token_addr in dict.fromkeys(token_addresses)
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                log.error("signal_processing_error", error=str(result))
+    
+    @staticmethod
+    async def _react(message: discord.Message, *emojis: str):
+        """Add reactions in order (discord.py throttles per bucket)."""
+        for emoji in emojis:
+            await message.add_reaction(emoji)
     
     async def _validate_and_trade(
         self,
@@ -154,7 +184,7 @@ class TradingBotDiscord(commands.Bot):
         source_channel: str,
         message: discord.Message,
     ):
-        """Validate signal and execute trade if valid.
+        """Validate signal and hand valid ones to the trading loop.
         
         Args:
             token_address: Solana token address
@@ -177,48 +207,46 @@ class TradingBotDiscord(commands.Bot):
             
             # React to message based on validation
             if result.is_valid:
-                await message.add_reaction("✅")
-                await message.add_reaction("🚀")
+                # Hand off to trading loop (fetches market data + executes)
+                signal_processor.push_signal(Signal(
+                    source=source_channel,
+                    token_address=token_address,
+                    token_name='UNKNOWN',
+                    confidence=result.score / 100.0,
+                    timestamp=datetime.now(),
+                    # Loop übernimmt das Ergebnis statt erneut zu validieren
+                    metadata={'message_id': message.id, 'validation': result},
+                ))
                 
-                # Execute trade
                 if settings.ALLOW_REAL_TRANSACTIONS:
-                    # TODO: Get token data from DexScreener
-                    token_data = {
-                        'address': token_address,
-                        'name': 'UNKNOWN',
-                        'price_usd': 0.0,
-                    }
-                    
-                    analysis = {
-                        'confidence': result.score / 100.0,
-                        'reason': f"Validated signal (score: {result.score})",
-                        'target_multiplier': 3.0,
-                    }
-                    
-                    success = await trade_manager.execute_trade(token_data, analysis)
-                    
-                    if success:
-                        await message.reply(
-                            f"🚀 Trade executed!\n"
-                            f"Token: `{token_address[:8]}...`\n"
-                            f"Validation Score: {result.score}/100\n"
-                            f"Target: 3x"
-                        )
+                    reply = (
+                        f"🚀 Signal queued for execution!\n"
+                        f"Token: `{token_address[:8]}...`\n"
+                        f"Validation Score: {result.score}/100"
+                    )
                 else:
-                    await message.reply(
+                    reply = (
                         f"✅ Signal validated ({result.score}/100)\n"
                         f"_Simulation mode - no trade executed_"
                     )
-            else:
-                await message.add_reaction("⚠️")
                 
+                # Reactions + reply concurrently (separate REST calls)
+                await asyncio.gather(
+                    self._react(message, "✅", "🚀"),
+                    message.reply(reply),
+                )
+            elif result.score < 50:
                 # Send warning if low score
-                if result.score < 50:
-                    warning_msg = "\n".join(result.warnings[:3])
-                    await message.reply(
+                warning_msg = "\n".join(result.warnings[:3])
+                await asyncio.gather(
+                    message.add_reaction("⚠️"),
+                    message.reply(
                         f"⚠️  Signal rejected ({result.score}/100)\n"
                         f"```{warning_msg}```"
-                    )
+                    ),
+                )
+            else:
+                await message.add_reaction("⚠️")
         
         except Exception as e:
             log.error("validation_error", token=token_address, error=str(e))
@@ -328,15 +356,22 @@ class TradingBotDiscord(commands.Bot):
 
 async def run_discord_bot():
     """Start Discord bot."""
-    if not settings.DISCORD_BOT_TOKEN:
+    # Einmal strippen: Check und Login nutzen denselben Wert (.env Newlines)
+    token = (settings.DISCORD_BOT_TOKEN or "").strip()
+    if not token:
         log.error("discord_bot_no_token")
         print("❌ DISCORD_BOT_TOKEN not configured in .env.production")
         return
     
+    if not TradingBotDiscord.BOT_TOKEN_PATTERN.fullmatch(token):
+        log.error("discord_bot_token_malformed")
+        print("❌ DISCORD_BOT_TOKEN looks malformed (expected 3 dot-separated parts)")
+        return
+    
     bot = TradingBotDiscord()
     
     try:
-        await bot.start(settings.DISCORD_BOT_TOKEN)
+        await bot.start(token)
     except Exception as e:
         log.error("discord_bot_error", error=str(e))
         print(f"❌ Discord bot error: {e}")
@@ -344,30 +379,40 @@ async def run_discord_bot():
 
 async def main():
     """CLI Entry Point."""
-    print("=" * 70)
-    print("🤖 Starting Discord Trading Bot")
-    print("=" * 70)
-    print()
-    
-    if not settings.DISCORD_BOT_TOKEN:
-        print("❌ Error: DISCORD_BOT_TOKEN not set")
-        print()
-        print("Setup:")
-        print("  1. Run: python setup_discord_server.py")
-        print("  2. Add bot to your server")
-        print("  3. Configure .env.production")
-        return
-    
-    if not settings.DISCORD_CHANNEL_IDS:
-        print("⚠️  Warning: No channels configured")
-        print("   Bot will not monitor any channels")
-        print()
-        print("Add to .env.production:")
-        print("   DISCORD_CHANNEL_IDS=123456789,987654321")
-        print()
-    
-    await run_discord_bot()
+    try:
+        write_lines([
+            "=" * 70,
+            "🤖 Starting Discord Trading Bot",
+            "=" * 70,
+            "",
+        ])
+        
+        if not settings.DISCORD_BOT_TOKEN:
+            write_lines([
+                "❌ Error: DISCORD_BOT_TOKEN not set",
+                "",
+                "Setup:",
+                "  1. Run: python setup_discord_server.py",
+                "  2. Add bot to your server",
+                "  3. Configure .env.production",
+            ])
+            return
+        
+        if not settings.DISCORD_CHANNEL_IDS:
+            write_lines([
+                "⚠️  Warning: No channels configured",
+                "   Bot will not monitor any channels",
+                "",
+                "Add to .env.production:",
+                "   DISCORD_CHANNEL_IDS=123456789,987654321",
+                "",
+            ])
+        
+        await run_discord_bot()
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from src.core.eventloop import run
+    run(main())
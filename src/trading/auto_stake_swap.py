@@ -4,34 +4,62 @@ Konvertiert automatisch SOL zu Liquid Staking Tokens (mSOL, rSOL, jitoSOL)
 für passives Einkommen während des Tradings.
 """
 
-import os
 import asyncio
-from typing import Optional, Literal
+from typing import Dict, Iterable, List, Optional, Literal, Tuple
 from dataclasses import dataclass
 from decimal import Decimal
 
 import aiohttp
+import numpy as np
 from solders.pubkey import Pubkey
 from solders.keypair import Keypair
 from solana.rpc.async_api import AsyncClient
 
 from src.core.logger import log
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.http import close_session, get_session
+from src.core.jsonutil import loads
 from src.blockchain.wallet import get_wallet
 
 # Token Adressen
 TOKENS = {
     "SOL": "So11111111111111111111111111111111111111112",
-    "mSOL": "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",  # Marinade - 7.0% APY
-    "rSOL": "rSoLbUZpGbhKT8azFTvWLSNYKQvqoQEGKqC7pzDnBsP",  # Raydium - 6.5% APY
-    "jitoSOL": "J1toso1uCk3RLmjorhTtrVwY9HJ7X8V9yYac6Y7kGCPn",  # Jito - 7.5% APY
-    "bSOL": "bSo13r4TkiE4KumL71LsHTPpL2euBYLFx6h9HP3piy1",  # BlazeStake - 6.8% APY
+    "mSOL": "mSoLzYCxHdYgdzU16g5QSh3i5K3z3KZK7ytfqcJm7So",  # Marinade
+    "rSOL": "rSoLbUZpGbhKT8azFTvWLSNYKQvqoQEGKqC7pzDnBsP",  # Raydium
+    "jitoSOL": "J1toso1uCk3RLmjorhTtrVwY9HJ7X8V9yYac6Y7kGCPn",  # Jito
+    "bSOL": "bSo13r4TkiE4KumL71LsHTPpL2euBYLFx6h9HP3piy1",  # BlazeStake
+}
+
+# Staking Token → (Protocol, APY %)
+STAKING_INFO = {
+    "mSOL": ("Marinade", 7.0),
+    "rSOL": ("Raydium", 6.5),
+    "jitoSOL": ("Jito", 7.5),
+    "bSOL": ("BlazeStake", 6.8),
 }
 
 StakingToken = Literal["mSOL", "rSOL", "jitoSOL", "bSOL"]
+STAKING_TOKENS: Tuple[StakingToken, ...] = ("mSOL", "rSOL", "jitoSOL", "bSOL")
+
+
+def rank_staking_tokens(amount_sol: float) -> List[Tuple[str, float, float]]:
+    """Sortiere Staking Tokens nach APY und berechne den Jahresertrag.
+    
+    Args:
+        amount_sol: Zu stakender SOL Betrag
+    
+    Returns:
+        [(token, apy, yearly_gain_sol), ...] absteigend nach APY
+    """
+    tokens = np.array(STAKING_TOKENS)
+    apys = np.array([STAKING_INFO[t][1] for t in STAKING_TOKENS], dtype=np.float64)
+    gains = amount_sol * apys / 100.0
+    order = np.argsort(-apys, kind="stable")
+    return list(zip(tokens[order].tolist(), apys[order].tolist(), gains[order].tolist()))
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapQuote:
     """Jupiter Swap Quote."""
     input_mint: str
@@ -42,7 +70,7 @@ class SwapQuote:
     route_plan: list
 
 
-@dataclass
+@dataclass(slots=True)
 class SwapResult:
     """Swap Ausführungs-Ergebnis."""
     success: bool
@@ -67,8 +95,9 @@ class AutoStakeSwap:
         self.client: Optional[AsyncClient] = None
         self.wallet: Optional[Keypair] = None
         
-        # Jupiter API V6
-        self.jupiter_api = "https://quote-api.jup.ag/v6"
+        # Jupiter API V6 (Metis Endpoint falls konfiguriert, sonst Public API),
+        # ohne trailing "/" für f"{self.jupiter_api}/quote"
+        self.jupiter_api = (settings.JUPITER_BASE_URL or settings.JUPITER_FALLBACK_URL).rstrip('/')
         self.session: Optional[aiohttp.ClientSession] = None
     
     async def __aenter__(self):
@@ -82,15 +111,27 @@ class AutoStakeSwap:
         """Initialisiere Clients."""
         self.client = AsyncClient(self.rpc_url)
         self.wallet = get_wallet(self.wallet_key)
-        self.session = aiohttp.ClientSession()
+        self.session = await get_session()  # geteilter Pool, Keep-Alive zu Jupiter/RPC
         log.info("auto_stake_swap_initialized", wallet=str(self.wallet.pubkey()))
     
     async def close(self):
         """Schließe Connections."""
         if self.client:
             await self.client.close()
-        if self.session:
-            await self.session.close()
+        # Geteilte Session wird erst beim Shutdown geschlossen (close_session)
+        self.session = None
+    
+    def _failover_on_status(self, status: int):
+        """Wechsle bei Rate Limit / Server Error auf den Public Endpoint."""
+        fallback = settings.JUPITER_FALLBACK_URL.rstrip('/')
+        if (status == 429 or status >= 500) and self.jupiter_api != fallback:
+            log.warning(
+                "jupiter_failover",
+                status=status,
+                from_url=self.jupiter_api,
+                to_url=fallback,
+            )
+            self.jupiter_api = fallback
     
     async def get_sol_balance(self) -> float:
         """Hole SOL Balance."""
@@ -99,6 +140,66 @@ class AutoStakeSwap:
             return 0.0
         return float(response.value) / 1e9
     
+    async def get_balances(self, token: StakingToken) -> Tuple[float, float]:
+        """Hole SOL + Staking Token Balance in einem JSON-RPC Batch Request.
+        
+        Args:
+            token: Staking Token (z.B. "mSOL")
+        
+        Returns:
+            (sol_balance, token_balance)
+        """
+        balances = await self.get_staking_balances((token,))
+        return balances["SOL"], balances[token]
+    
+    async def get_staking_balances(
+        self,
+        tokens: Iterable[StakingToken] = STAKING_TOKENS,
+    ) -> Dict[str, float]:
+        """Hole SOL + mehrere Staking Token Balances in einem Batch Request.
+        
+        Args:
+            tokens: Staking Tokens (Default: alle)
+        
+        Returns:
+            Dict {"SOL": balance, token: balance, ...} (0.0 bei Fehler)
+        """
+        tokens = tuple(tokens)
+        balances = dict.fromkeys(("SOL", *tokens), 0.0)
+        
+        owner = str(self.wallet.pubkey())
+        batch = [{"jsonrpc": "2.0", "id": 0, "method": "getBalance", "params": [owner]}]
+        batch += [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getTokenAccountsByOwner",
+                "params": [owner, {"mint": TOKENS[token]}, {"encoding": "jsonParsed"}],
+            }
+            for i, token in enumerate(tokens, start=1)
+        ]
+        
+        try:
+            async with self.session.post(self.rpc_url, json=batch, timeout=10) as resp:
+                if resp.status != 200:
+                    log.error("balance_batch_failed", status=resp.status)
+                    return balances
+                
+                responses = {r.get("id"): r.get("result") or {} for r in loads(await resp.read())}
+        
+        except Exception as e:
+            log.error("balance_batch_error", error=str(e))
+            return balances
+        
+        balances["SOL"] = float(responses.get(0, {}).get("value") or 0) / 1e9
+        
+        for i, token in enumerate(tokens, start=1):
+            for account in responses.get(i, {}).get("value") or []:
+                info = account["account"]["data"]["parsed"]["info"]
+                balances[token] += float(info["tokenAmount"].get("uiAmount") or 0)
+        
+        return balances
+    
     async def get_quote(
         self,
         from_token: str,
@@ -135,9 +236,10 @@ class AutoStakeSwap:
             async with self.session.get(url, params=params, timeout=10) as resp:
                 if resp.status != 200:
                     log.error("jupiter_quote_failed", status=resp.status)
+                    self._failover_on_status(resp.status)
                     return None
                 
-                data = await resp.json()
+                data = loads(await resp.read())
                 
                 return SwapQuote(
                     input_mint=input_mint,
@@ -199,9 +301,10 @@ class AutoStakeSwap:
                 if resp.status != 200:
                     error_msg = await resp.text()
                     log.error("jupiter_swap_failed", status=resp.status, error=error_msg)
+                    self._failover_on_status(resp.status)
                     return SwapResult(success=False, error=error_msg)
                 
-                swap_data = await resp.json()
+                swap_data = loads(await resp.read())
                 swap_transaction = swap_data["swapTransaction"]
             
             # 2. Sign and send transaction
@@ -293,48 +396,58 @@ class AutoStakeSwap:
 
 async def main():
     """CLI Demo."""
-    print("=" * 70)
-    print("🚀 Auto-Stake Swap - Jupiter Integration")
-    print("=" * 70)
-    print()
-    
-    # Load config
-    from dotenv import load_dotenv
-    load_dotenv(".env.production")
-    
-    async with AutoStakeSwap() as swapper:
-        # Show balance
-        balance = await swapper.get_sol_balance()
-        print(f"💰 Aktuelle Balance: {balance:.6f} SOL")
-        print()
-        
-        # Show options
-        print("📊 Verfügbare Staking Tokens:")
-        print("   1. mSOL (Marinade)   - 7.0% APY")
-        print("   2. rSOL (Raydium)    - 6.5% APY")
-        print("   3. jitoSOL (Jito)    - 7.5% APY")
-        print("   4. bSOL (BlazeStake) - 6.8% APY")
-        print()
-        
-        # Demo swap
-        target = "mSOL"
-        print(f"🔄 Demo: SOL → {target}")
-        print()
-        
-        result = await swapper.auto_stake(
-            target_token=target,
-            percentage=90.0,
-            simulate_only=True,
-        )
+    try:
+        write_lines([
+            "=" * 70,
+            "🚀 Auto-Stake Swap - Jupiter Integration",
+            "=" * 70,
+            "",
+        ])
         
-        if result.success:
-            print(f"✅ Swap erfolgreich (Simulation)")
-            print(f"   Input:  {result.input_amount:.6f} SOL")
-            print(f"   Output: {result.output_amount:.6f} {target}")
-            print(f"   Rate:   {result.output_amount/result.input_amount:.4f}")
-        else:
-            print(f"❌ Swap fehlgeschlagen: {result.error}")
+        async with AutoStakeSwap() as swapper:
+            # Show balances (SOL + all staking tokens in one RPC round-trip)
+            balances = await swapper.get_staking_balances()
+            lines = [f"💰 Aktuelle Balance: {balances['SOL']:.6f} SOL"]
+            lines += [
+                f"🥩 Gestaked:         {balances[token]:.6f} {token}"
+                for token in STAKING_TOKENS
+                if balances[token] > 0
+            ]
+            
+            # Show options (sorted by APY, yearly gain for 90% of balance)
+            stakeable = balances["SOL"] * 0.9
+            lines += ["", "📊 Verfügbare Staking Tokens:"]
+            lines += [
+                f"   {i}. {f'{token} ({STAKING_INFO[token][0]})':<20} - {apy:.1f}% APY  → +{gain:.6f} SOL/Jahr"
+                for i, (token, apy, gain) in enumerate(rank_staking_tokens(stakeable), start=1)
+            ]
+            
+            target = "mSOL"
+            write_lines(lines + [
+                "",
+                f"🔄 Demo: SOL → {target}",
+                "",
+            ])
+            
+            result = await swapper.auto_stake(
+                target_token=target,
+                percentage=90.0,
+                simulate_only=True,
+            )
+            
+            if result.success:
+                write_lines([
+                    f"✅ Swap erfolgreich (Simulation)",
+                    f"   Input:  {result.input_amount:.6f} SOL",
+                    f"   Output: {result.output_amount:.6f} {target}",
+                    f"   Rate:   {result.output_amount/result.input_amount:.4f}",
+                ])
+            else:
+                print(f"❌ Swap fehlgeschlagen: {result.error}")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from src.core.eventloop import run
+    run(main())
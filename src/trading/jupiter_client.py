@@ -8,25 +8,34 @@ This is intentionally small and conservative: we only do read-only requests
 and never rely on Jupiter for critical decisions without fallback.
 """
 
-import os
 import time
 from typing import Optional
 
 import requests
+from src.core.config import settings
+from src.core.jsonutil import loads
 from src.core.logger import log
 
-JUPITER_URL = os.getenv("JUPITER_PRICE_URL", "https://quote-api.jup.ag/v1/price")
-JUPITER_TIMEOUT = float(os.getenv("JUPITER_TIMEOUT", "5"))
-JUPITER_RETRIES = int(os.getenv("JUPITER_RETRIES", "3"))
-JUPITER_BACKOFF = float(os.getenv("JUPITER_BACKOFF", "0.5"))
+JUPITER_URL = settings.JUPITER_PRICE_URL
+JUPITER_TIMEOUT = settings.JUPITER_TIMEOUT
+JUPITER_RETRIES = settings.JUPITER_RETRIES
+JUPITER_BACKOFF = settings.JUPITER_BACKOFF
 
 
-def _request_with_retries(url: str, timeout: float, retries: int, backoff: float) -> Optional[requests.Response]:
+def _request_with_retries(
+    url: str,
+    timeout: float,
+    retries: int,
+    backoff: float,
+    session: Optional[requests.Session] = None,
+) -> Optional[requests.Response]:
+    """GET with exponential backoff. Pass a `requests.Session` to reuse keep-alive connections."""
+    http = session or requests
     attempt = 0
     while attempt < retries:
         try:
             log.info("jupiter_request_attempt", url=url, attempt=attempt + 1)
-            r = requests.get(url, timeout=timeout)
+            r = http.get(url, timeout=timeout)
             r.raise_for_status()
             return r
         except Exception as e:
@@ -38,9 +47,9 @@ def _request_with_retries(url: str, timeout: float, retries: int, backoff: float
     return None
 
 
-def ping_jupiter() -> bool:
+def ping_jupiter(session: Optional[requests.Session] = None) -> bool:
     """Ping Jupiter price API, with retries. Returns True if reachable."""
-    r = _request_with_retries(JUPITER_URL, JUPITER_TIMEOUT, JUPITER_RETRIES, JUPITER_BACKOFF)
+    r = _request_with_retries(JUPITER_URL, JUPITER_TIMEOUT, JUPITER_RETRIES, JUPITER_BACKOFF, session=session)
     if r is None:
         log.error("jupiter_unreachable", url=JUPITER_URL)
         return False
@@ -48,13 +57,13 @@ def ping_jupiter() -> bool:
     return True
 
 
-def get_jupiter_price_stub() -> Optional[dict]:
+def get_jupiter_price_stub(session: Optional[requests.Session] = None) -> Optional[dict]:
     """Attempt to fetch a price; returns parsed JSON or None on failure."""
-    r = _request_with_retries(JUPITER_URL, JUPITER_TIMEOUT, JUPITER_RETRIES, JUPITER_BACKOFF)
+    r = _request_with_retries(JUPITER_URL, JUPITER_TIMEOUT, JUPITER_RETRIES, JUPITER_BACKOFF, session=session)
     if not r:
         return None
     try:
-        return r.json()
+        return loads(r.content)
     except Exception:
         log.warning("jupiter_invalid_json", url=JUPITER_URL)
         return None
@@ -3,22 +3,23 @@
 WebSocket monitoring für Raydium/Orca Pool Creations.
 """
 
-import asyncio
-import json
 from typing import Optional, Dict, List
 from datetime import datetime
 from dataclasses import dataclass
 
-import websockets
 from solders.pubkey import Pubkey
 
+from src.blockchain.ws_hub import WSHub, ws_hub
 from src.core.logger import log
 from src.core.config import settings
+from src.core.console import write_lines
+from src.core.http import close_session
+from src.core.jsonutil import loads
 from src.signals.validator import signal_validator
 from src.trading.manager import trade_manager
 
 
-@dataclass
+@dataclass(slots=True)
 class NewPool:
     """Neuer Liquiditätspool."""
     pool_address: str
@@ -42,20 +43,31 @@ class LiquiditySniper:
     # Program IDs
     RAYDIUM_AMM_V4 = "675kPX9MHTjS2zt1qfr1NYHuzeLXfQM9H24wFSUt1Mp8"
     ORCA_WHIRLPOOL = "whirLbMiicVdio4qvUfM5KAg6Ct8VwpYzGff3uctyCc"
+    # Empfänger der Raydium Pool-Creation Fee: taucht nur in initialize2
+    # Transaktionen auf, nicht in jedem Swap wie die AMM Program ID
+    RAYDIUM_CREATE_FEE_ACCOUNT = "7YttLkHDoNj9wyDur5pM1ejNaAvT9X4eqaYcHQqtj2G5"
+    
+    # Log-Marker der Pool-Initialisierung pro DEX
+    POOL_INIT_MARKERS = {
+        "raydium": "initialize2",
+        "orca": "Instruction: InitializePool",
+    }
     
     def __init__(
         self,
-        ws_url: str = "wss://api.mainnet-beta.solana.com",
+        ws_url: Optional[str] = None,
         min_liquidity_sol: float = 5.0,
         max_buy_sol: float = 0.1,
     ):
         """
         Args:
-            ws_url: Solana WebSocket URL
+            ws_url: Solana WebSocket URL (Default: settings.SOLANA_WS_URL)
             min_liquidity_sol: Minimum Pool Liquidity
             max_buy_sol: Maximum buy amount per snipe
         """
-        self.ws_url = ws_url
+        self.ws_url = ws_url or settings.SOLANA_WS_URL
+        # Shared connection unless a dedicated endpoint is requested
+        self.hub = ws_hub if ws_url is None else WSHub(ws_url)
         self.min_liquidity_sol = min_liquidity_sol
         self.max_buy_sol = max_buy_sol
         
@@ -73,41 +85,19 @@ class LiquiditySniper:
             dex: "raydium" oder "orca"
         """
         program_id = self.RAYDIUM_AMM_V4 if dex == "raydium" else self.ORCA_WHIRLPOOL
+        mention = self.RAYDIUM_CREATE_FEE_ACCOUNT if dex == "raydium" else program_id
         
         log.info("sniper_starting", dex=dex, program=program_id)
-        print(f"🎯 Liquidity Sniper gestartet - {dex.upper()}")
-        print(f"   Min Liquidity: {self.min_liquidity_sol} SOL")
-        print(f"   Max Buy: {self.max_buy_sol} SOL")
-        print()
+        write_lines([
+            f"🎯 Liquidity Sniper gestartet - {dex.upper()}",
+            f"   Min Liquidity: {self.min_liquidity_sol} SOL",
+            f"   Max Buy: {self.max_buy_sol} SOL",
+            "",
+        ])
         
-        while True:
-            try:
-                async with websockets.connect(self.ws_url) as ws:
-                    # Subscribe to program logs
-                    subscribe = {
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "logsSubscribe",
-                        "params": [
-                            {"mentions": [program_id]},
-                            {"commitment": "confirmed"}
-                        ]
-                    }
-                    
-                    await ws.send(json.dumps(subscribe))
-                    log.info("sniper_subscribed", dex=dex)
-                    
-                    # Process incoming logs
-                    async for message in ws:
-                        await self._process_log(message, dex)
-            
-            except websockets.exceptions.ConnectionClosed:
-                log.warning("sniper_disconnected", dex=dex)
-                await asyncio.sleep(5)
-            
-            except Exception as e:
-                log.error("sniper_error", dex=dex, error=str(e))
-                await asyncio.sleep(10)
+        # Program logs über die geteilte Verbindung (Reconnect macht der Hub)
+        async for message in self.hub.subscribe_logs([mention]):
+            await self._process_log(message, dex)
     
     async def _process_log(self, message: str, dex: str):
         """Process WebSocket log message.
@@ -116,25 +106,25 @@ class LiquiditySniper:
             message: WebSocket message
             dex: DEX name
         """
+        # Substring pre-filter before parsing: most frames are plain swaps
+        marker = self.POOL_INIT_MARKERS.get(dex, "nitialize")
+        if marker not in message:
+            return
+        
         try:
-            data = json.loads(message)
+            data = loads(message)
             
-            if 'result' not in data:
-                return
+            # logsNotification: {"params": {"result": {"value": {...}}}}
+            value = data.get('params', {}).get('result', {}).get('value')
             
-            result = data['result']
-            
-            if 'value' not in result:
+            # Failed transactions create no pool
+            if not value or value.get('err') is not None:
                 return
             
-            value = result['value']
             logs = value.get('logs', [])
             
             # Check for pool initialization
-            is_pool_init = any(
-                'initialize' in log.lower() or 'create' in log.lower()
-                for log in logs
-            )
+            is_pool_init = any(marker in log for log in logs)
             
             if not is_pool_init:
                 return
@@ -268,52 +258,59 @@ async def run_sniper(dex: str = "raydium"):
     try:
         await sniper.start_monitoring(dex=dex)
     except KeyboardInterrupt:
-        print()
-        print("=" * 70)
-        print("🛑 Sniper gestoppt")
-        print("=" * 70)
-        print()
-        
         stats = sniper.get_stats()
-        print("📊 Statistics:")
-        print(f"   Pools Detected: {stats['pools_detected']}")
-        print(f"   Pools Sniped:   {stats['pools_sniped']}")
-        print(f"   Pools Rejected: {stats['pools_rejected']}")
-        print(f"   Success Rate:   {stats['success_rate']*100:.1f}%")
+        write_lines([
+            "",
+            "=" * 70,
+            "🛑 Sniper gestoppt",
+            "=" * 70,
+            "",
+            "📊 Statistics:",
+            f"   Pools Detected: {stats['pools_detected']}",
+            f"   Pools Sniped:   {stats['pools_sniped']}",
+            f"   Pools Rejected: {stats['pools_rejected']}",
+            f"   Success Rate:   {stats['success_rate']*100:.1f}%",
+        ])
+
+
+_CLI_BANNER = (
+    "=" * 70,
+    "🎯 Liquidity Sniper - First Buyer Advantage",
+    "=" * 70,
+    "",
+    "⚠️  WARNING: High Risk Strategy!",
+    "   - New tokens can be scams",
+    "   - Many pools rug pull",
+    "   - Only invest what you can lose",
+    "",
+    "💡 Strategy:",
+    "   1. Monitor new Raydium pools",
+    "   2. Validate token safety",
+    "   3. Buy with max priority fee",
+    "   4. Target: 3-10x in minutes",
+    "   5. Auto-exit at target or -50%",
+    "",
+)
 
 
 async def main():
     """CLI Entry Point."""
-    print("=" * 70)
-    print("🎯 Liquidity Sniper - First Buyer Advantage")
-    print("=" * 70)
-    print()
-    
-    print("⚠️  WARNING: High Risk Strategy!")
-    print("   - New tokens can be scams")
-    print("   - Many pools rug pull")
-    print("   - Only invest what you can lose")
-    print()
-    print("💡 Strategy:")
-    print("   1. Monitor new Raydium pools")
-    print("   2. Validate token safety")
-    print("   3. Buy with max priority fee")
-    print("   4. Target: 3-10x in minutes")
-    print("   5. Auto-exit at target or -50%")
-    print()
-    
-    choice = input("Start sniper? (yes/no): ").strip().lower()
-    
-    if choice != "yes":
-        print("❌ Aborted")
-        return
-    
-    print()
-    print("🚀 Starting Raydium sniper...")
-    print()
-    
-    await run_sniper(dex="raydium")
+    try:
+        write_lines(_CLI_BANNER)
+        
+        choice = input("Start sniper? (yes/no): ").strip().lower()
+        
+        if choice != "yes":
+            print("❌ Aborted")
+            return
+        
+        write_lines(["", "🚀 Starting Raydium sniper...", ""])
+        
+        await run_sniper(dex="raydium")
+    finally:
+        await close_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    from src.core.eventloop import run
+    run(main())
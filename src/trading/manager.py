@@ -10,7 +10,7 @@ from src.blockchain.wallet import wallet_manager
 from src.blockchain.client import solana_client
 from src.blockchain.transaction_optimizer import TransactionOptimizer
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     token_address: str
     token_name: str
@@ -22,8 +22,12 @@ class Position:
     status: str = "open"  # open, closed, stopped
 
 class TradeManager:
+    POSITION_CHECK_INTERVAL_S = 15
+    
     def __init__(self):
         self._logger = log.bind(module="trade_manager")
+        # Buys/Sells seriell - Sizing basiert auf der Wallet Balance
+        self._trade_lock = asyncio.Lock()
         self.positions: List[Position] = []
         self.daily_loss_sol: float = 0.0
         self.trades_today: int = 0
@@ -64,8 +68,11 @@ class TradeManager:
         return trade_size
         
     async def execute_trade(self, token_data: Dict, analysis: Dict) -> bool:
-        """Execute a buy trade"""
-        
+        """Execute a buy trade (serialized with other buys/sells)"""
+        async with self._trade_lock:
+            return await self._execute_trade(token_data, analysis)
+    
+    async def _execute_trade(self, token_data: Dict, analysis: Dict) -> bool:
         # Safety checks
         if settings.EMERGENCY_STOP:
             self._logger.error("trade_blocked_emergency_stop")
@@ -190,10 +197,14 @@ class TradeManager:
         # Check each position for exit conditions
         from src.analysis.dexscreener import dexscreener
         
+        # Alle Preise in einem Batch Request statt einem Request pro Position
+        prices = await dexscreener.get_tokens_batch(
+            [p.token_address for p in open_positions]
+        )
+        
         for position in open_positions:
             try:
-                # Get current price
-                token_data = await dexscreener.get_token_data(position.token_address)
+                token_data = prices.get(position.token_address)
                 
                 if not token_data:
                     continue
@@ -212,20 +223,31 @@ class TradeManager:
                     self._logger.info("🎯 take_profit_triggered",
                                     token=position.token_name,
                                     profit_pct=f"{price_change*100:.1f}%")
-                    await self._exit_position(position, "take_profit", current_price)
+                    async with self._trade_lock:
+                        await self._exit_position(position, "take_profit", current_price)
                 
                 # Stop Loss: Down 30%
                 elif price_change <= -position.stop_loss_pct:
                     self._logger.warning("🛑 stop_loss_triggered",
                                        token=position.token_name,
                                        loss_pct=f"{price_change*100:.1f}%")
-                    await self._exit_position(position, "stop_loss", current_price)
+                    async with self._trade_lock:
+                        await self._exit_position(position, "stop_loss", current_price)
                     
             except Exception as e:
                 self._logger.error("position_monitoring_error",
                                  token=position.token_name,
                                  error=str(e))
     
+    async def monitor_positions_loop(self):
+        """Run monitor_positions periodically (own task, independent of signals)"""
+        while True:
+            try:
+                await self.monitor_positions()
+            except Exception as e:
+                self._logger.error("position_monitor_loop_error", error=str(e))
+            await asyncio.sleep(self.POSITION_CHECK_INTERVAL_S)
+    
     async def _exit_position(self, position: Position, reason: str, exit_price: float):
         """Exit a position (sell tokens) - AUTO SELL"""
         try:
@@ -112,12 +112,8 @@ class OnChainSwapper:
                 self._logger.error("failed_to_build_swap_instruction")
                 return False
             
-            # Send Transaction via Helius RPC (funktioniert in Codespace!)
-            await solana_client.connect()
-            
-            # Get recent blockhash
-            blockhash_resp = await solana_client.client.get_latest_blockhash()
-            recent_blockhash = blockhash_resp.value.blockhash
+            # Get recent blockhash (cached / kept warm by the refresher)
+            recent_blockhash = await solana_client.get_latest_blockhash()
             
             # Create transaction
             message = Message.new_with_blockhash(
@@ -128,11 +124,11 @@ class OnChainSwapper:
             
             tx = Transaction([keypair], message, recent_blockhash)
             
-            # Send
-            result = await solana_client.client.send_transaction(tx)
+            # Send (raced across all configured RPCs, mit Preflight Simulation)
+            signature = await solana_client.send_raw_transaction(bytes(tx), skip_preflight=False)
             
             self._logger.info("✅ onchain_swap_sent",
-                            signature=str(result.value)[:16],
+                            signature=signature[:16],
                             token=token_address[:8])
             
             return True
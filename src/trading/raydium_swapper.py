@@ -6,6 +6,8 @@ Nutzt Raydium AMM direkt für Swaps wenn Jupiter nicht verfügbar.
 import asyncio
 from typing import Optional
 import aiohttp
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 from src.core.config import settings
 from src.blockchain.wallet import wallet_manager
@@ -22,16 +24,13 @@ class RaydiumSwapper:
         self._logger = log.bind(module="raydium_swapper")
     
     async def _ensure_session(self):
-        """Stelle sicher dass Session existiert."""
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        """Stelle sicher dass Session existiert (geteilte Pool-Session)."""
+        if not self.session or self.session.closed:
+            self.session = await get_session()
     
     async def close(self):
-        """Schließe Session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Session freigeben (geteilte Session schließt close_session())."""
+        self.session = None
     
     async def swap_sol_to_token(
         self,
@@ -95,7 +94,7 @@ class RaydiumSwapper:
                 if resp.status != 200:
                     return None
                 
-                data = await resp.json()
+                data = loads(await resp.read())
                 
                 # Suche Pool mit beiden Tokens
                 for pool in data:
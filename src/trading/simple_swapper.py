@@ -7,6 +7,8 @@ import asyncio
 import base64
 from typing import Optional
 import aiohttp
+from src.core.http import get_session
+from src.core.jsonutil import loads
 from src.core.logger import log
 from src.core.config import settings
 from src.blockchain.wallet import wallet_manager
@@ -18,21 +20,22 @@ class JupiterSwapper:
     """Einfacher Jupiter V6 Swapper mit Fallback."""
     
     def __init__(self):
-        # Multiple Jupiter API endpoints for fallback
-        self.jupiter_endpoints = [
-            "https://quote-api.jup.ag/v6",
+        # Multiple Jupiter API endpoints for fallback (Metis zuerst falls konfiguriert).
+        # Ohne trailing "/" - Pfade werden als f"{endpoint}/quote" angehängt
+        self.jupiter_endpoints = list(dict.fromkeys(url.rstrip('/') for url in filter(None, [
+            settings.JUPITER_BASE_URL,
+            settings.JUPITER_FALLBACK_URL,
             "https://api.jup.ag/quote/v6",  # Alternative
-        ]
+        ])))
         self.active_endpoint = self.jupiter_endpoints[0]
         self.session: Optional[aiohttp.ClientSession] = None
         self._logger = log.bind(module="jupiter_swapper")
         self.jupiter_available = None  # None = ungetestet, True/False nach Test
     
     async def _ensure_session(self):
-        """Stelle sicher dass Session existiert."""
-        if not self.session:
-            timeout = aiohttp.ClientTimeout(total=10, connect=5)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+        """Stelle sicher dass Session existiert (geteilte Pool-Session)."""
+        if not self.session or self.session.closed:
+            self.session = await get_session()
     
     async def _test_jupiter_availability(self) -> bool:
         """Teste ob Jupiter API erreichbar ist."""
@@ -60,11 +63,22 @@ class JupiterSwapper:
         self._logger.warning("⚠️ jupiter_unavailable_fallback_mode")
         return False
     
+    def _failover_on_status(self, status: int):
+        """Bei Rate Limit / Server Error nächsten Endpoint für den nächsten Call nutzen."""
+        if status != 429 and status < 500:
+            return
+        idx = self.jupiter_endpoints.index(self.active_endpoint) if self.active_endpoint in self.jupiter_endpoints else -1
+        next_endpoint = self.jupiter_endpoints[(idx + 1) % len(self.jupiter_endpoints)]
+        if next_endpoint != self.active_endpoint:
+            self._logger.warning("jupiter_failover",
+                               status=status,
+                               from_url=self.active_endpoint,
+                               to_url=next_endpoint)
+            self.active_endpoint = next_endpoint
+    
     async def close(self):
-        """Schließe Session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
+        """Session freigeben (geteilte Session schließt close_session())."""
+        self.session = None
     
     async def swap_sol_to_token(
         self,
@@ -113,10 +127,11 @@ class JupiterSwapper:
             async with self.session.get(url, params=params) as resp:
                 if resp.status != 200:
                     self._logger.error("jupiter_quote_failed", status=resp.status)
+                    self._failover_on_status(resp.status)
                     # Fallback zu Simulation
                     return await self._simulate_swap(token_address, amount_sol)
                 
-                quote = await resp.json()
+                quote = loads(await resp.read())
                 
                 out_amount = int(quote.get("outAmount", 0))
                 price_impact = float(quote.get("priceImpactPct", 0))
@@ -151,15 +166,17 @@ class JupiterSwapper:
                     "wrapAndUnwrapSol": True,
                     # keep conservative defaults
                     "asLegacyTransaction": False,
+                    "computeUnitPriceMicroLamports": await solana_client.get_priority_fee(),
                 }
 
                 async with self.session.post(swap_url, json=payload) as resp:
                     if resp.status != 200:
                         error_msg = await resp.text()
                         self._logger.error("jupiter_swap_failed", status=resp.status, error=error_msg[:200])
+                        self._failover_on_status(resp.status)
                         return False
 
-                    swap_data = await resp.json()
+                    swap_data = loads(await resp.read())
                     swap_tx_b64 = swap_data.get("swapTransaction")
 
                 if not swap_tx_b64:
@@ -179,20 +196,13 @@ class JupiterSwapper:
 
                 signed = VersionedTransaction.populate(vtx.message, sigs)
 
-                await solana_client.connect()
-                send_resp = await solana_client.client.send_raw_transaction(
-                    bytes(signed),
-                    opts={
-                        "skip_preflight": True,
-                        "preflight_commitment": "confirmed",
-                    },
-                )
+                signature = await solana_client.send_raw_transaction(bytes(signed))
 
                 self._logger.info(
                     "✅ swap_sent",
                     token=token_address,
                     amount_sol=amount_sol,
-                    signature=str(send_resp.value)[:16] if getattr(send_resp, "value", None) else None,
+                    signature=signature[:16],
                 )
                 return True
                 
@@ -321,9 +331,10 @@ class JupiterSwapper:
             async with self.session.get(url, params=params, timeout=10) as resp:
                 if resp.status != 200:
                     self._logger.error("jupiter_sell_quote_failed", status=resp.status)
+                    self._failover_on_status(resp.status)
                     return False
                 
-                quote = await resp.json()
+                quote = loads(await resp.read())
                 out_sol = int(quote.get("outAmount", 0)) / 1e9
 
                 if not settings.ALLOW_REAL_TRANSACTIONS:
@@ -345,15 +356,17 @@ class JupiterSwapper:
                     "userPublicKey": user_pubkey,
                     "wrapAndUnwrapSol": True,
                     "asLegacyTransaction": False,
+                    "computeUnitPriceMicroLamports": await solana_client.get_priority_fee(),
                 }
 
                 async with self.session.post(swap_url, json=payload) as resp:
                     if resp.status != 200:
                         error_msg = await resp.text()
                         self._logger.error("jupiter_sell_swap_failed", status=resp.status, error=error_msg[:200])
+                        self._failover_on_status(resp.status)
                         return False
 
-                    swap_data = await resp.json()
+                    swap_data = loads(await resp.read())
                     swap_tx_b64 = swap_data.get("swapTransaction")
 
                 if not swap_tx_b64:
@@ -372,20 +385,13 @@ class JupiterSwapper:
 
                 signed = VersionedTransaction.populate(vtx.message, sigs)
 
-                await solana_client.connect()
-                send_resp = await solana_client.client.send_raw_transaction(
-                    bytes(signed),
-                    opts={
-                        "skip_preflight": True,
-                        "preflight_commitment": "confirmed",
-                    },
-                )
+                signature = await solana_client.send_raw_transaction(bytes(signed))
 
                 self._logger.info(
                     "✅ sell_sent",
                     token=token_address,
                     output_sol=out_sol,
-                    signature=str(send_resp.value)[:16] if getattr(send_resp, "value", None) else None,
+                    signature=signature[:16],
                 )
                 return True
                 
@@ -0,0 +1,27 @@
+import asyncio
+from datetime import datetime
+
+import run_advanced_bot
+from src.signals.processor import Signal
+from src.signals.validator import ValidationResult
+
+
+def _signal(metadata):
+    return Signal('discord_calls', 'tok', 'UNKNOWN', 0.8, datetime.now(), metadata)
+
+
+def test_evaluate_signal_reuses_discord_validation(monkeypatch):
+    calls = []
+
+    async def _validate(token_address, source_channel=None):
+        calls.append(token_address)
+        return ValidationResult(False, 0, {}, [], token_address, datetime.now())
+
+    monkeypatch.setattr(run_advanced_bot.signal_validator, 'validate_signal', _validate)
+    validated = ValidationResult(True, 80, {}, [], 'tok', datetime.now())
+
+    assert asyncio.run(run_advanced_bot.evaluate_signal(_signal({'validation': validated}))) is validated
+    assert calls == []
+
+    asyncio.run(run_advanced_bot.evaluate_signal(_signal({})))
+    assert calls == ['tok']
@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.core.cache import async_ttl_cache
+
+
+def test_concurrent_calls_are_coalesced():
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def run():
+        return await asyncio.gather(*(fetch('a') for _ in range(5)), fetch('b'))
+
+    assert asyncio.run(run()) == ['A'] * 5 + ['B']
+    assert calls == ['a', 'b']
+
+
+def test_results_are_cached_until_ttl():
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def cached(x):
+        calls.append(x)
+        return x
+
+    @async_ttl_cache(ttl=0)
+    async def expired(x):
+        calls.append(x)
+        return x
+
+    async def run():
+        await cached(1)
+        await cached(1)
+        await expired(2)
+        await expired(2)
+
+    asyncio.run(run())
+    assert calls == [1, 2, 2]
+
+
+def test_exceptions_are_not_cached():
+    calls = []
+
+    @async_ttl_cache(ttl=60)
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise ValueError('boom')
+        return 'ok'
+
+    async def run():
+        with pytest.raises(ValueError):
+            await flaky()
+        return await flaky()
+
+    assert asyncio.run(run()) == 'ok'
+    assert len(calls) == 2
@@ -0,0 +1,20 @@
+import asyncio
+
+from src.blockchain.client import SolanaClient
+
+
+def test_send_raw_transaction_preflight_flag(monkeypatch):
+    client = SolanaClient()
+    client.rpc_urls = ['https://rpc.test']
+    sent = []
+
+    async def _rpc(url, method, params, timeout=10):
+        sent.append(params[1])
+        return 'sig'
+
+    monkeypatch.setattr(client, '_rpc', _rpc)
+
+    assert asyncio.run(client.send_raw_transaction(b'\x01')) == 'sig'
+    asyncio.run(client.send_raw_transaction(b'\x01', skip_preflight=False))
+
+    assert [p['skipPreflight'] for p in sent] == [True, False]
@@ -0,0 +1,137 @@
+import asyncio
+import json
+
+from src.analysis.dexscreener import DexScreenerClient
+
+
+class _FakeResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self._payload = payload
+
+    async def read(self):
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self, payload, status=200):
+        self.payload = payload
+        self.status = status
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _FakeResponse(self.status, self.payload)
+
+
+def _pair(address, liquidity, price="1.0"):
+    return {
+        'baseToken': {'address': address, 'name': address.upper(), 'symbol': address[:3]},
+        'priceUsd': price,
+        'liquidity': {'usd': liquidity},
+        'volume': {'h24': 100},
+        'priceChange': {'h24': 1, 'h1': 0},
+    }
+
+
+def test_get_tokens_batch_single_request_and_best_pair():
+    client = DexScreenerClient()
+    client.session = _FakeSession({'pairs': [
+        _pair('aaa', 1000, price="1.0"),
+        _pair('aaa', 5000, price="2.0"),
+        _pair('bbb', 200),
+        _pair('zzz', 99999),  # not requested
+    ]})
+
+    result = asyncio.run(client.get_tokens_batch(['aaa', 'bbb', 'ccc', 'aaa']))
+
+    assert len(client.session.urls) == 1
+    assert client.session.urls[0].endswith('/tokens/aaa,bbb,ccc')
+    assert set(result) == {'aaa', 'bbb'}
+    assert result['aaa']['price_usd'] == 2.0
+    assert result['aaa']['liquidity'] == 5000.0
+
+
+def test_get_tokens_batch_http_error_returns_empty():
+    client = DexScreenerClient()
+    client.session = _FakeSession({}, status=429)
+
+    assert asyncio.run(client.get_tokens_batch(['aaa'])) == {}
+
+
+def test_get_tokens_batch_uses_ttl_cache():
+    client = DexScreenerClient()
+    client.session = _FakeSession({'pairs': [_pair('aaa', 1000)]})
+
+    asyncio.run(client.get_tokens_batch(['aaa']))
+    result = asyncio.run(client.get_tokens_batch(['aaa']))
+    token = asyncio.run(client.get_token_data('aaa'))
+
+    assert len(client.session.urls) == 1
+    assert result['aaa'] is token
+
+
+def test_get_tokens_batch_splits_into_chunks():
+    client = DexScreenerClient()
+    client.MAX_BATCH_SIZE = 2
+    client.session = _FakeSession({'pairs': [_pair('aaa', 1), _pair('ccc', 1)]})
+
+    result = asyncio.run(client.get_tokens_batch(['aaa', 'bbb', 'ccc']))
+
+    assert len(client.session.urls) == 2
+    assert client.session.urls[1].endswith('/tokens/ccc')
+    assert set(result) == {'aaa', 'ccc'}
+
+
+def test_trending_memecoins_queries_all_searches():
+    pair = _pair('pumpaaa', 10_000)
+    pair.update(chainId='solana', volume={'h24': 50_000})
+    client = DexScreenerClient()
+    client.session = _FakeSession({'pairs': [pair]})
+
+    result = asyncio.run(client.get_trending_memecoins())
+
+    assert len(client.session.urls) == 5
+    assert result == ['pumpaaa']
+
+
+def test_trending_memecoins_accepts_string_numbers():
+    pair = _pair('pumpbbb', '10000.5')
+    pair.update(chainId='solana', volume={'h24': '50000'})
+    client = DexScreenerClient()
+    client.session = _FakeSession({'pairs': [pair]})
+
+    assert asyncio.run(client.get_trending_memecoins()) == ['pumpbbb']
+
+
+def test_get_token_data_concurrent_callers_share_request():
+    client = DexScreenerClient()
+    client.session = _FakeSession({'pairs': [_pair('aaa', 1000)]})
+
+    async def _run():
+        return await asyncio.gather(*(client.get_token_data('aaa') for _ in range(3)))
+
+    results = asyncio.run(_run())
+
+    assert len(client.session.urls) == 1
+    assert results[0] == results[1] == results[2] is not None
+
+
+def test_token_cache_evicts_least_recently_used():
+    client = DexScreenerClient()
+    client.TOKEN_CACHE_MAXSIZE = 2
+    client._cache_put('aaa', {'n': 1})
+    client._cache_put('bbb', {'n': 2})
+
+    assert client._cache_get('aaa') == {'n': 1}  # aaa is now most recent
+    client._cache_put('ccc', {'n': 3})
+
+    assert list(client._token_cache) == ['aaa', 'ccc']
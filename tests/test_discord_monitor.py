@@ -0,0 +1,36 @@
+import asyncio
+
+from src.core.config import settings
+from src.social import discord_monitor
+from src.social.discord_monitor import TradingBotDiscord
+
+
+def test_channel_ids_skip_malformed_entries(monkeypatch):
+    monkeypatch.setattr(settings, 'DISCORD_CHANNEL_IDS', '123456789012345678, abc,42,')
+
+    ids = TradingBotDiscord._parse_channel_ids()
+
+    assert ids == frozenset({123456789012345678})
+
+
+def test_bot_token_pattern():
+    pattern = TradingBotDiscord.BOT_TOKEN_PATTERN
+    token = 'MTExNjQ4MzY1NzE2NzQxNzQ1Ng.Gabcde.' + 'x' * 38
+
+    assert pattern.fullmatch(token)
+    assert not pattern.fullmatch(token.rsplit('.', 1)[0])
+
+
+def test_run_discord_bot_logs_in_with_stripped_token(monkeypatch):
+    token = 'MTExNjQ4MzY1NzE2NzQxNzQ1Ng.Gabcde.' + 'x' * 38
+    started = []
+
+    async def _start(self, value):
+        started.append(value)
+
+    monkeypatch.setattr(settings, 'DISCORD_BOT_TOKEN', f' {token}\n')
+    monkeypatch.setattr(TradingBotDiscord, 'start', _start)
+
+    asyncio.run(discord_monitor.run_discord_bot())
+
+    assert started == [token]
@@ -0,0 +1,76 @@
+import asyncio
+import json
+
+from src.analysis.gmgn import GMGNClient
+
+
+class _FakeResponse:
+    def __init__(self, payload, status=200):
+        self._payload = payload
+        self.status = status
+
+    async def json(self):
+        return self._payload
+
+    async def read(self):
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self, payload, statuses=()):
+        self.payload = payload
+        self.statuses = list(statuses)
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _FakeResponse(self.payload, self.statuses.pop(0) if self.statuses else 200)
+
+
+def test_get_token_data_cached_and_coalesced():
+    client = GMGNClient()
+    client.session = _FakeSession({'data': {'name': 'TEST', 'price': 1.5, 'liquidity': 9000}})
+
+    async def _run():
+        first = await asyncio.gather(*(client.get_token_data('tok1') for _ in range(3)))
+        again = await client.get_token_data('tok1')
+        return first, again
+
+    first, again = asyncio.run(_run())
+
+    assert len(client.session.urls) == 1
+    assert first[0]['price_usd'] == 1.5 and again is first[0]
+
+
+def test_get_token_data_parses_numeric_fields():
+    client = GMGNClient()
+    client.session = _FakeSession({'data': {
+        'name': 'TEST', 'liquidity': '9000.5', 'holder_count': '42', 'sell_24h': 3,
+    }})
+
+    parsed = asyncio.run(client.get_token_data('tok2'))
+
+    assert parsed['liquidity'] == parsed['liquidity_usd'] == 9000.5
+    assert parsed['holders'] == 42 and parsed['sell_count_24h'] == 3
+    assert parsed['price_usd'] == 0.0 and parsed['symbol'] == 'Unknown'
+
+
+def test_get_token_data_does_not_cache_errors():
+    client = GMGNClient()
+    client.session = _FakeSession({'data': {'name': 'TEST', 'price': 2}}, statuses=[503])
+
+    async def _run():
+        return await client.get_token_data('tok3'), await client.get_token_data('tok3')
+
+    failed, recovered = asyncio.run(_run())
+
+    assert failed is None and recovered['price_usd'] == 2.0
+    assert len(client.session.urls) == 2
@@ -0,0 +1,38 @@
+import asyncio
+import json
+
+from src.trading.liquidity_sniper import LiquiditySniper
+
+
+def _frame(logs, err=None, signature='sig1'):
+    return json.dumps({
+        'jsonrpc': '2.0',
+        'method': 'logsNotification',
+        'params': {
+            'result': {'value': {'signature': signature, 'err': err, 'logs': logs}},
+            'subscription': 1,
+        },
+    })
+
+
+def _sniper():
+    sniper = LiquiditySniper(ws_url='wss://example.invalid')
+    sniper.analyzed = []
+
+    async def _analyze(signature, dex):
+        sniper.analyzed.append(signature)
+
+    sniper._analyze_and_snipe = _analyze
+    return sniper
+
+
+def test_only_successful_pool_inits_are_analyzed():
+    sniper = _sniper()
+    init_logs = ['Program log: initialize2: InitializeInstruction2 { nonce: 254 }']
+
+    asyncio.run(sniper._process_log(_frame(['Program log: ray_log: swap']), 'raydium'))
+    asyncio.run(sniper._process_log(_frame(init_logs, err={'InstructionError': [0, 'Custom']}), 'raydium'))
+    asyncio.run(sniper._process_log(_frame(init_logs, signature='sig2'), 'raydium'))
+
+    assert sniper.analyzed == ['sig2']
+    assert sniper.stats['pools_detected'] == 1
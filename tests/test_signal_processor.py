@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from src.signals.processor import Signal, SignalProcessor
+
+
+def _signal(confidence=0.7, age_s=0, metadata=None):
+    return Signal(
+        source='test',
+        token_address='addr',
+        token_name='TEST',
+        confidence=confidence,
+        timestamp=datetime.now() - timedelta(seconds=age_s),
+        metadata=metadata if metadata is not None else {},
+    )
+
+
+def test_filter_valid_applies_all_thresholds():
+    processor = SignalProcessor()
+    ok = _signal(metadata={'volume_24h': 10_000})
+    no_volume_data = _signal()
+    low_confidence = _signal(confidence=0.1)
+    low_volume = _signal(metadata={'volume_24h': 10})
+    stale = _signal(age_s=3600)
+
+    signals = [low_confidence, ok, low_volume, no_volume_data, stale]
+
+    assert processor.filter_valid(signals) == [ok, no_volume_data]
+
+
+def test_filter_valid_empty():
+    assert SignalProcessor().filter_valid([]) == []
+
+
+def test_pushed_signals_are_drained_in_order():
+    processor = SignalProcessor()
+    first, second = _signal(), _signal(confidence=0.9)
+
+    processor.push_signal(first)
+    processor.push_signal(second)
+
+    assert asyncio.run(processor.wait_for_signals(timeout=1)) == [first, second]
+
+
+def test_stale_pushed_signal_is_dropped():
+    processor = SignalProcessor()
+    stale, fresh = _signal(age_s=SignalProcessor.MAX_SIGNAL_AGE_S + 60), _signal(confidence=0.9)
+
+    processor.push_signal(stale)
+    processor.push_signal(fresh)
+
+    assert asyncio.run(processor.wait_for_signals(timeout=1)) == [fresh]
+
+
+def test_collect_dexscreener_uses_one_batch_lookup(monkeypatch):
+    from src.analysis.dexscreener import dexscreener
+
+    batches = []
+
+    async def _trending(limit=10):
+        return ['a1', 'a2', 'a3']
+
+    async def _batch(addresses):
+        batches.append(list(addresses))
+        return {a: {'name': a.upper(), 'volume_24h': 1000} for a in addresses if a != 'a2'}
+
+    monkeypatch.setattr(dexscreener, 'get_trending_memecoins', _trending)
+    monkeypatch.setattr(dexscreener, 'get_tokens_batch', _batch)
+
+    signals = asyncio.run(SignalProcessor()._collect_dexscreener())
+
+    assert batches == [['a1', 'a2', 'a3']]
+    assert [s.token_address for s in signals] == ['a1', 'a3']
+
+
+def test_aggregate_signals_keeps_latest_with_mean_confidence():
+    processor = SignalProcessor()
+    old, new = _signal(confidence=0.6, age_s=10), _signal(confidence=1.0)
+    other = Signal('test', 'other', 'OTHER', 0.8, datetime.now(), {})
+
+    result = processor.aggregate_signals([old, other, new])
+
+    assert result == [new, other]
+    assert new.confidence == 0.8 and new.metadata['signal_count'] == 2
+    assert 'signal_count' not in other.metadata
+
+
+def test_collect_signals_filters_and_merges_in_one_pass(monkeypatch):
+    from src.signals import bus
+
+    processor = SignalProcessor()
+    scanned = _signal(confidence=0.5, age_s=5)
+    pushed = _signal(confidence=0.9)
+    stale = _signal(age_s=3600)
+
+    async def _dexscreener():
+        return [scanned]
+
+    monkeypatch.setattr(bus, 'drain', lambda: [pushed, stale])
+    monkeypatch.setattr(processor, '_collect_dexscreener', _dexscreener)
+
+    result = asyncio.run(processor.collect_signals())
+
+    assert result == [pushed]
+    assert pushed.confidence == 0.7 and pushed.metadata['signal_count'] == 2
@@ -0,0 +1,12 @@
+from src.core.config import settings
+from src.trading.simple_swapper import JupiterSwapper
+
+
+def test_jupiter_endpoints_strip_trailing_slash(monkeypatch):
+    monkeypatch.setattr(settings, 'JUPITER_BASE_URL', 'https://metis.example/abc123/')
+    monkeypatch.setattr(settings, 'JUPITER_FALLBACK_URL', 'https://quote-api.jup.ag/v6')
+
+    swapper = JupiterSwapper()
+
+    assert swapper.jupiter_endpoints[0] == 'https://metis.example/abc123'
+    assert f"{swapper.active_endpoint}/quote" == 'https://metis.example/abc123/quote'
@@ -0,0 +1,200 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+from solders.signature import Signature
+from solders.transaction_status import TransactionConfirmationStatus as Status
+
+from src.blockchain import transaction_optimizer
+from src.blockchain.transaction_optimizer import RPCEndpoint, TransactionOptimizer
+
+
+class _FakeClient:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+        self.batches = []
+
+    async def get_signature_statuses(self, signatures):
+        if not all(isinstance(s, Signature) for s in signatures):
+            raise TypeError("argument 'signatures': expected Signature")
+        self.calls += 1
+        self.batches.append([str(s) for s in signatures])
+        status = self.statuses.pop(0) if self.statuses else None
+        return SimpleNamespace(value=[status] * len(signatures))
+
+
+class _FakeHub:
+    def __init__(self, frames=()):
+        self.frames = frames
+
+    async def subscribe_signature(self, signature):
+        for frame in self.frames:
+            yield frame
+        await asyncio.Event().wait()
+
+
+def _sig():
+    return str(Signature.new_unique())
+
+
+def _status(confirmation_status, err=None):
+    return SimpleNamespace(confirmation_status=confirmation_status, err=err)
+
+
+def test_confirmation_polls_with_backoff_without_ws(monkeypatch):
+    monkeypatch.setattr(transaction_optimizer, 'ws_hub', _FakeHub())
+    optimizer = TransactionOptimizer()
+    optimizer.STATUS_POLL_INTERVAL_S = 0.001
+    client = _FakeClient([None, _status(Status.Processed), _status(Status.Confirmed)])
+
+    asyncio.run(optimizer._wait_for_confirmation(client, _sig(), timeout=5))
+
+    assert client.calls == 3
+
+
+def test_confirmation_polls_all_pending_signatures_in_one_call(monkeypatch):
+    monkeypatch.setattr(transaction_optimizer, 'ws_hub', _FakeHub())
+    optimizer = TransactionOptimizer()
+    optimizer.STATUS_POLL_INTERVAL_S = 0.001
+    client = _FakeClient([_status(Status.Finalized)])
+    sig1, sig2 = _sig(), _sig()
+
+    async def _run():
+        await asyncio.gather(
+            optimizer._wait_for_confirmation(client, sig1, timeout=5),
+            optimizer._wait_for_confirmation(client, sig2, timeout=5),
+        )
+
+    asyncio.run(_run())
+
+    assert client.batches == [[sig1, sig2]]
+    assert optimizer._pending == {}
+
+
+def test_confirmation_returns_on_ws_notification(monkeypatch):
+    frame = '{"method":"signatureNotification","params":{"result":{"value":{"err":null}},"subscription":1}}'
+    monkeypatch.setattr(transaction_optimizer, 'ws_hub', _FakeHub([frame]))
+    optimizer = TransactionOptimizer()
+    optimizer.STATUS_POLL_INTERVAL_S = 10.0
+    client = _FakeClient([])
+
+    asyncio.run(asyncio.wait_for(optimizer._wait_for_confirmation(client, _sig(), timeout=30), 2))
+
+    assert client.calls <= 2
+
+
+class _FakeResponse:
+    def __init__(self, status, payload, delay=0):
+        self.status = status
+        self._payload = payload
+        self.delay = delay
+
+    async def read(self):
+        await asyncio.sleep(self.delay)
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self, ok_host, rpc_error=False):
+        self.ok_host = ok_host
+        self.rpc_error = rpc_error
+        self.urls = []
+
+    def post(self, url, **kwargs):
+        self.urls.append(url)
+        if self.ok_host in url:
+            # Accepting region answers last when the others report RPC errors
+            return _FakeResponse(200, {'result': 'bundle-1'}, delay=0.01 if self.rpc_error else 0)
+        if self.rpc_error:
+            return _FakeResponse(200, {'error': {'code': -32602, 'message': 'bundle rejected'}})
+        return _FakeResponse(503, {})
+
+
+def test_send_via_jito_fans_out_to_all_regions():
+    optimizer = TransactionOptimizer()
+    optimizer.session = _FakeSession('tokyo')
+
+    bundle_id = asyncio.run(optimizer.send_via_jito(b'\x01'))
+
+    assert bundle_id == 'bundle-1'
+    assert len(optimizer.session.urls) == len(TransactionOptimizer.JITO_ENDPOINTS)
+
+
+def test_send_via_jito_ignores_json_rpc_errors():
+    optimizer = TransactionOptimizer()
+    optimizer.session = _FakeSession('tokyo', rpc_error=True)
+
+    assert asyncio.run(optimizer.send_via_jito(b'\x01')) == 'bundle-1'
+
+
+def test_fastest_rpc_ranking_cached_and_refreshed_with_ewma():
+    optimizer = TransactionOptimizer()
+    optimizer.session = _FakeSession('')
+    optimizer.RPC_ENDPOINTS = [RPCEndpoint('https://a', 'A', 1), RPCEndpoint('https://b', 'B', 2)]
+    latencies = {'https://a': [50.0, 300.0], 'https://b': [100.0, 100.0]}
+
+    async def _probe(endpoint):
+        return latencies[endpoint.url].pop(0)
+
+    optimizer._test_rpc_latency = _probe
+
+    async def _run():
+        first = await optimizer.get_fastest_rpc()
+        cached = await optimizer.get_fastest_rpc()
+        optimizer._ranked_at -= optimizer.RANK_TTL_S
+        stale = await optimizer.get_fastest_rpc()
+        await optimizer._ranking_task
+        return first, cached, stale, await optimizer.get_fastest_rpc()
+
+    first, cached, stale, refreshed = asyncio.run(_run())
+
+    assert first == cached == stale == 'https://a'
+    assert refreshed == 'https://b'
+    assert optimizer.RPC_ENDPOINTS[0].avg_latency_ms == 0.7 * 50.0 + 0.3 * 300.0
+
+
+def test_rpc_latency_probe_checks_status_and_deep_health():
+    optimizer = TransactionOptimizer()
+    optimizer.session = _FakeSession('healthy')
+    healthy, down = RPCEndpoint('https://healthy', 'H', 1), RPCEndpoint('https://down', 'D', 2)
+
+    async def _run():
+        return (
+            await optimizer._test_rpc_latency(healthy),
+            await optimizer._test_rpc_latency(down),
+            await optimizer._test_rpc_latency(healthy, deep=True),
+        )
+
+    light, failed, deep = asyncio.run(_run())
+
+    assert light < float('inf') and failed == float('inf')
+    assert deep == float('inf')  # fake answers {'result': 'bundle-1'}, not 'ok'
+
+
+def test_priority_instructions_follow_network_fee(monkeypatch):
+    from solders.compute_budget import set_compute_unit_price
+
+    async def _network_fee():
+        return 50_000
+
+    monkeypatch.setattr(transaction_optimizer.solana_client, 'get_priority_fee', _network_fee)
+    optimizer = TransactionOptimizer(priority_fee_lamports=10_000)
+
+    async def _run():
+        before = optimizer.get_priority_instructions()
+        await optimizer._fee_task
+        return before, optimizer.get_priority_instructions()
+
+    before, after = asyncio.run(_run())
+
+    assert before[1] == set_compute_unit_price(10_000)
+    assert after[1] == set_compute_unit_price(50_000)
@@ -0,0 +1,232 @@
+import asyncio
+import json
+import time
+from collections import deque
+from types import SimpleNamespace
+
+from solders.keypair import Keypair
+
+from src.signals import validator as validator_module
+from src.signals.validator import SignalValidator
+
+
+class _FakeResponse:
+    def __init__(self, payload, status=200):
+        self._payload = payload
+        self.status = status
+
+    async def read(self):
+        return json.dumps(self._payload).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSession:
+    closed = False
+
+    def __init__(self, payload, statuses=()):
+        self.payload = payload
+        self.statuses = list(statuses)
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _FakeResponse(self.payload, self.statuses.pop(0) if self.statuses else 200)
+
+
+def test_liquidity_and_volume_checks_share_one_request():
+    validator = SignalValidator()
+    validator.session = _FakeSession({'pairs': [
+        {'liquidity': {'usd': 25_000}, 'volume': {'h24': 1_000}, 'priceChange': {'h24': 12}},
+        {'liquidity': {'usd': 40_000}},
+    ]})
+
+    async def _run():
+        return await asyncio.gather(
+            validator._check_liquidity('tok1'),
+            validator._check_volume_legitimacy('tok1'),
+        )
+
+    liquidity, volume_ok = asyncio.run(_run())
+
+    assert len(validator.session.urls) == 1
+    assert liquidity == 40_000.0 and volume_ok
+
+
+def test_track_signal_prunes_only_expired_mentions():
+    validator = SignalValidator()
+    validator.SWEEP_EVERY = 2
+    expired = time.monotonic() - validator.SIGNAL_WINDOW_S - 1
+    validator.signal_cache['old'] = deque([expired])
+    validator.signal_cache['tok'] = deque([expired, time.monotonic()])
+
+    assert validator._track_signal('tok', 'discord') == 2
+    assert 'old' in validator.signal_cache  # untouched until the sweep
+
+    assert validator._track_signal('tok', 'telegram') == 3
+    assert set(validator.signal_cache) == {'tok'}
+
+
+class _FakeRpc:
+    def __init__(self, accounts):
+        self.accounts = accounts
+        self.calls = []
+
+    async def get_multiple_accounts(self, pubkeys):
+        self.calls.append([str(p) for p in pubkeys])
+        return SimpleNamespace(value=[self.accounts.get(str(p)) for p in pubkeys])
+
+
+def _mint_data(tag):
+    return tag.to_bytes(4, 'little') + bytes(78)
+
+
+def test_mint_authority_coption_tag():
+    none_tag, some_tag = str(Keypair().pubkey()), str(Keypair().pubkey())
+    validator = SignalValidator()
+    validator.client = _FakeRpc({
+        none_tag: SimpleNamespace(data=_mint_data(0)),
+        some_tag: SimpleNamespace(data=_mint_data(1)),
+    })
+
+    results = asyncio.run(validator.batch_check_mint_authority([none_tag, some_tag]))
+
+    assert results == {none_tag: True, some_tag: False}
+
+
+def test_concurrent_mint_checks_share_one_rpc_call():
+    revoked = str(Keypair().pubkey())
+    active = str(Keypair().pubkey())
+    missing = str(Keypair().pubkey())
+    validator = SignalValidator()
+    validator.client = _FakeRpc({
+        revoked: SimpleNamespace(data=bytes(82)),
+        active: SimpleNamespace(data=b'\x01\x00\x00\x00' + bytes(78)),
+    })
+
+    async def _run():
+        return await asyncio.gather(*(
+            validator._check_mint_authority(a) for a in (revoked, active, missing)
+        ))
+
+    assert asyncio.run(_run()) == [True, False, False]
+    assert validator.client.calls == [[revoked, active, missing]]
+
+
+class _FlakyRpc(_FakeRpc):
+    async def get_multiple_accounts(self, pubkeys):
+        if not self.calls:
+            self.calls.append(None)
+            raise ConnectionError('rpc down')
+        return await super().get_multiple_accounts(pubkeys)
+
+
+def test_failed_mint_check_is_not_cached():
+    token = str(Keypair().pubkey())
+    validator = SignalValidator()
+    validator.client = _FlakyRpc({token: SimpleNamespace(data=bytes(82))})
+
+    async def _run():
+        try:
+            await validator._check_mint_authority(token)
+        except ConnectionError:
+            pass
+        else:
+            raise AssertionError('RPC error was swallowed')
+        return await validator._check_mint_authority(token)
+
+    assert asyncio.run(_run()) is True
+    assert len(validator.client.calls) == 2
+
+
+def test_dexscreener_fetch_retries_rate_limits(monkeypatch):
+    async def _no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(validator_module.asyncio, 'sleep', _no_sleep)
+    validator = SignalValidator()
+    validator.session = _FakeSession({'pairs': [{'liquidity': {'usd': 1}}]}, statuses=[429, 503])
+
+    assert asyncio.run(validator._fetch_dexscreener_pairs('tok3')) == [{'liquidity': {'usd': 1}}]
+    assert len(validator.session.urls) == 3
+
+    validator.session = _FakeSession({}, statuses=[404])
+    assert asyncio.run(validator._fetch_dexscreener_pairs('tok4')) == []
+    assert len(validator.session.urls) == 1
+
+
+def test_dexscreener_server_error_raises_and_is_not_cached():
+    validator = SignalValidator()
+    validator.session = _FakeSession({'pairs': [{'liquidity': {'usd': 3}}]}, statuses=[502])
+
+    async def _run():
+        try:
+            await validator._fetch_dexscreener_pairs('tok6')
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError('HTTP 502 read as not listed')
+        return await validator._check_liquidity('tok6')
+
+    assert asyncio.run(_run()) == 3.0
+    assert len(validator.session.urls) == 2
+
+
+def test_dexscreener_fetch_raises_when_retries_exhausted(monkeypatch):
+    async def _no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(validator_module.asyncio, 'sleep', _no_sleep)
+    validator = SignalValidator()
+    validator.session = _FakeSession({'pairs': [{'liquidity': {'usd': 7}}]}, statuses=[429, 429, 429])
+
+    async def _run():
+        try:
+            await validator._fetch_dexscreener_pairs('tok5')
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError('rate limit was not raised')
+        return await validator._check_liquidity('tok5')
+
+    assert asyncio.run(_run()) == 7.0  # failure was not cached
+    assert len(validator.session.urls) == 4
+
+
+def test_validate_batch_shares_rpc_and_keeps_order():
+    tokens = [str(Keypair().pubkey()) for _ in range(3)]
+    validator = SignalValidator()
+    validator.client = _FakeRpc({t: SimpleNamespace(data=bytes(82)) for t in tokens})
+    validator.session = _FakeSession({'pairs': [{'liquidity': {'usd': 50_000}}]})
+
+    results = asyncio.run(validator.validate_batch([tokens[0], tokens[1], tokens[0], tokens[2]]))
+
+    assert [r.token_address for r in results] == [tokens[0], tokens[1], tokens[0], tokens[2]]
+    assert results[0] is results[2]
+    assert all(r.checks['mint_revoked'] and r.checks['liquidity'] for r in results)
+    assert validator.client.calls == [tokens]
+    assert len(validator.session.urls) == 3
+
+
+def test_validate_batch_bounds_concurrency(monkeypatch):
+    validator = SignalValidator()
+    validator.BATCH_CONCURRENCY = 2
+    active, peak = 0, 0
+
+    async def _validate(token_address, source_channel='unknown'):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return token_address
+
+    monkeypatch.setattr(validator, 'validate_signal', _validate)
+
+    tokens = [f'tok{i}' for i in range(6)]
+    assert asyncio.run(validator.validate_batch(tokens)) == tokens
+    assert peak == 2
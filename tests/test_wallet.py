@@ -0,0 +1,29 @@
+import base58
+from solders.keypair import Keypair
+
+from src.blockchain.utils import is_valid_pubkey, to_pubkey
+from src.blockchain.wallet import get_wallet
+
+
+def test_get_wallet_decodes_once_per_key():
+    private_key = base58.b58encode(bytes(Keypair())).decode()
+
+    first = get_wallet(private_key)
+    second = get_wallet(private_key)
+
+    assert first is second
+    assert str(first.pubkey()) == str(Keypair.from_bytes(base58.b58decode(private_key)).pubkey())
+
+
+def test_is_valid_pubkey():
+    assert is_valid_pubkey('So11111111111111111111111111111111111111112')
+    assert not is_valid_pubkey('1' * 44)  # base58 alphabet, but not 32 bytes
+    assert not is_valid_pubkey('0OIl' * 10)
+    assert not is_valid_pubkey('short')
+
+
+def test_to_pubkey_cached():
+    address = 'So11111111111111111111111111111111111111112'
+
+    assert to_pubkey(address) is to_pubkey(address)
+    assert str(to_pubkey(address)) == address
@@ -0,0 +1,34 @@
+import json
+
+from src.blockchain.ws_hub import WSHub, _Subscription, _subscription_id
+
+
+def _notification(sub_id, value):
+    return json.dumps({
+        'jsonrpc': '2.0',
+        'method': 'logsNotification',
+        'params': {'result': {'value': value}, 'subscription': sub_id},
+    })
+
+
+def test_subscription_id_parsed_without_json():
+    assert _subscription_id(_notification(42, {'logs': []})) == 42
+    assert _subscription_id('{"jsonrpc":"2.0","result":7,"id":1}') is None
+
+
+def test_frames_routed_to_matching_subscription():
+    hub = WSHub('wss://example.invalid')
+    raydium = hub._subs[1] = _Subscription('logsSubscribe', [])
+    orca = hub._subs[2] = _Subscription('logsSubscribe', [])
+
+    hub._handle_frame('{"jsonrpc":"2.0","result":100,"id":1}')
+    hub._handle_frame('{"jsonrpc":"2.0","result":200,"id":2}')
+
+    frame = _notification(200, {'logs': ['initialize2']})
+    hub._handle_frame(frame)
+    hub._handle_frame(_notification(999, {}))  # unknown subscription
+
+    assert raydium.sub_id == 100 and orca.sub_id == 200
+    assert raydium.queue.empty()
+    assert orca.queue.get_nowait() == frame
+    assert orca.queue.empty()